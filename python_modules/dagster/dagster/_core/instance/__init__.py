@@ -2322,6 +2322,24 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
         check.sequence_param(partition_key, "partition_key", of_type=str)
         self._event_storage.delete_dynamic_partition(partitions_def_name, partition_key)
 
+    @traced
+    def delete_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> None:
+        """Delete partitions for the specified :py:class:`DynamicPartitionsDefinition`.
+        Partitions that do not exist are ignored.
+
+        Args:
+            partitions_def_name (str): The name of the `DynamicPartitionsDefinition`.
+            partition_keys (Sequence[str]): Partition keys to delete.
+        """
+        check.str_param(partitions_def_name, "partitions_def_name")
+        check.sequence_param(partition_keys, "partition_keys", of_type=str)
+        if isinstance(partition_keys, str):
+            # Guard against a single string being passed in `partition_keys`
+            raise DagsterInvalidInvocationError("partition_keys must be a sequence of strings")
+        self._event_storage.delete_dynamic_partitions(partitions_def_name, partition_keys)
+
     @public
     @traced
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
@@ -2335,6 +2353,23 @@ def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) ->
         check.str_param(partition_key, "partition_key")
         return self._event_storage.has_dynamic_partition(partitions_def_name, partition_key)
 
+    @traced
+    def get_existing_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> AbstractSet[str]:
+        """Get the subset of the given partition keys that exist for the
+        :py:class:`DynamicPartitionsDefinition`.
+
+        Args:
+            partitions_def_name (str): The name of the `DynamicPartitionsDefinition`.
+            partition_keys (Sequence[str]): Partition keys to check.
+        """
+        check.str_param(partitions_def_name, "partitions_def_name")
+        check.sequence_param(partition_keys, "partition_keys", of_type=str)
+        return self._event_storage.get_existing_dynamic_partitions(
+            partitions_def_name, partition_keys
+        )
+
     # event subscriptions
 
     def _get_yaml_python_handlers(self) -> Sequence[logging.Handler]:
@@ -2926,6 +2961,13 @@ def add_instigator_state(self, state: "InstigatorState") -> "InstigatorState":
             check.failed("Schedule storage not available")
         return self._schedule_storage.add_instigator_state(state)
 
+    def add_instigator_states(
+        self, states: Sequence["InstigatorState"]
+    ) -> Sequence["InstigatorState"]:
+        if not self._schedule_storage:
+            check.failed("Schedule storage not available")
+        return self._schedule_storage.add_instigator_states(states)
+
     def update_instigator_state(self, state: "InstigatorState") -> "InstigatorState":
         if not self._schedule_storage:
             check.failed("Schedule storage not available")
@@ -2978,6 +3020,11 @@ def create_tick(self, tick_data: "TickData") -> "InstigatorTick":
     def update_tick(self, tick: "InstigatorTick"):
         return check.not_none(self._schedule_storage).update_tick(tick)
 
+    def update_tick_and_instigator_state(
+        self, tick: "InstigatorTick", state: "InstigatorState"
+    ) -> None:
+        check.not_none(self._schedule_storage).update_tick_and_instigator_state(tick, state)
+
     def purge_ticks(
         self,
         origin_id: str,
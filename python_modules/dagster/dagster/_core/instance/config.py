@@ -287,6 +287,17 @@ def sensors_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "jitter_loop_interval": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    "Whether to randomize the time the sensor daemon waits between iterations, so"
+                    " that multiple sensor daemons do not query code servers and storage in lockstep."
+                    " Each interval is up to 50% shorter or longer than usual, so the daemon"
+                    " iterates as often as it otherwise would on average."
+                ),
+            ),
         },
         is_required=False,
     )
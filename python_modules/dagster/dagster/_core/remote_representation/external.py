@@ -587,9 +587,11 @@ def get_python_origin(self) -> JobPythonOrigin:
         repository_python_origin = self.repository_handle.get_python_origin()
         return JobPythonOrigin(self.name, repository_python_origin)
 
+    @cached_method
     def get_external_origin(self) -> RemoteJobOrigin:
         return self.handle.get_external_origin()
 
+    @cached_method
     def get_external_origin_id(self) -> str:
         return self.get_external_origin().get_id()
 
@@ -952,9 +954,11 @@ def min_interval_seconds(self) -> int:
     def run_tags(self) -> Mapping[str, str]:
         return self._external_sensor_data.run_tags
 
+    @cached_method
     def get_external_origin(self) -> RemoteInstigatorOrigin:
         return self._handle.get_external_origin()
 
+    @cached_method
     def get_external_origin_id(self) -> str:
         return self.get_external_origin().get_id()
 
@@ -975,6 +979,7 @@ def sensor_selector(self) -> SensorSelector:
         )
 
     @property
+    @cached_method
     def selector_id(self) -> str:
         return create_snapshot_id(self.selector)
 
@@ -467,6 +467,18 @@ def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) ->
         """Check if a dynamic partition exists."""
         raise NotImplementedError()
 
+    def get_existing_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> Set[str]:
+        """Get the subset of the given partition keys that exist for a dynamic partitions
+        definition.
+        """
+        return {
+            partition_key
+            for partition_key in partition_keys
+            if self.has_dynamic_partition(partitions_def_name, partition_key)
+        }
+
     @abstractmethod
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
@@ -479,6 +491,13 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
         """Delete a partition for the specified dynamic partitions definition."""
         raise NotImplementedError()
 
+    def delete_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> None:
+        """Delete partitions for the specified dynamic partitions definition."""
+        for partition_key in partition_keys:
+            self.delete_dynamic_partition(partitions_def_name, partition_key)
+
     def alembic_version(self) -> Optional[AlembicVersion]:
         return None
 
@@ -2081,6 +2081,24 @@ def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) ->
 
         return len(results) > 0
 
+    def get_existing_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> Set[str]:
+        if not partition_keys:
+            return set()
+
+        self._check_partitions_table()
+        query = db_select([DynamicPartitionsTable.c.partition]).where(
+            db.and_(
+                DynamicPartitionsTable.c.partitions_def_name == partitions_def_name,
+                DynamicPartitionsTable.c.partition.in_(partition_keys),
+            )
+        )
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        return {cast(str, row[0]) for row in rows}
+
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
     ) -> None:
@@ -2122,6 +2140,23 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
                 )
             )
 
+    def delete_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> None:
+        if not partition_keys:
+            return
+
+        self._check_partitions_table()
+        with self.index_connection() as conn:
+            conn.execute(
+                DynamicPartitionsTable.delete().where(
+                    db.and_(
+                        DynamicPartitionsTable.c.partitions_def_name == partitions_def_name,
+                        DynamicPartitionsTable.c.partition.in_(partition_keys),
+                    )
+                )
+            )
+
     @cached_property
     def supports_global_concurrency_limits(self) -> bool:
         return self.has_table(ConcurrencySlotsTable.name)
@@ -579,6 +579,13 @@ def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) ->
             partitions_def_name, partition_key
         )
 
+    def get_existing_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> Set[str]:
+        return self._storage.event_log_storage.get_existing_dynamic_partitions(
+            partitions_def_name, partition_keys
+        )
+
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
     ) -> None:
@@ -591,6 +598,13 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
             partitions_def_name, partition_key
         )
 
+    def delete_dynamic_partitions(
+        self, partitions_def_name: str, partition_keys: Sequence[str]
+    ) -> None:
+        return self._storage.event_log_storage.delete_dynamic_partitions(
+            partitions_def_name, partition_keys
+        )
+
     def get_event_tags_for_asset(
         self,
         asset_key: "AssetKey",
@@ -743,6 +757,11 @@ def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional["In
     def add_instigator_state(self, state: "InstigatorState") -> "InstigatorState":
         return self._storage.schedule_storage.add_instigator_state(state)
 
+    def add_instigator_states(
+        self, states: Sequence["InstigatorState"]
+    ) -> Sequence["InstigatorState"]:
+        return self._storage.schedule_storage.add_instigator_states(states)
+
     def update_instigator_state(self, state: "InstigatorState") -> "InstigatorState":
         return self._storage.schedule_storage.update_instigator_state(state)
 
@@ -783,6 +802,11 @@ def create_tick(self, tick_data: "TickData") -> "InstigatorTick":
     def update_tick(self, tick: "InstigatorTick") -> "InstigatorTick":
         return self._storage.schedule_storage.update_tick(tick)
 
+    def update_tick_and_instigator_state(
+        self, tick: "InstigatorTick", state: "InstigatorState"
+    ) -> None:
+        return self._storage.schedule_storage.update_tick_and_instigator_state(tick, state)
+
     def purge_ticks(
         self,
         origin_id: str,
@@ -803,6 +827,15 @@ def add_auto_materialize_asset_evaluations(
             evaluation_id, asset_evaluations
         )
 
+    def update_auto_materialize_asset_evaluations(
+        self,
+        evaluation_id: int,
+        asset_evaluations: Sequence[AutomationConditionEvaluationWithRunIds],
+    ) -> None:
+        return self._storage.schedule_storage.update_auto_materialize_asset_evaluations(
+            evaluation_id, asset_evaluations
+        )
+
     def get_auto_materialize_asset_evaluations(
         self, asset_key: AssetKey, limit: int, cursor: Optional[int] = None
     ) -> Sequence["AutoMaterializeAssetEvaluationRecord"]:
@@ -60,6 +60,15 @@ def add_instigator_state(self, state: InstigatorState) -> InstigatorState:
             state (InstigatorState): The state to add
         """
 
+    def add_instigator_states(self, states: Sequence[InstigatorState]) -> Sequence[InstigatorState]:
+        """Add multiple instigator states to storage. Storages that can add the states in a single
+        round trip should override this.
+
+        Args:
+            states (Sequence[InstigatorState]): The states to add
+        """
+        return [self.add_instigator_state(state) for state in states]
+
     @abc.abstractmethod
     def update_instigator_state(self, state: InstigatorState) -> InstigatorState:
         """Update an instigator state in storage.
@@ -133,6 +142,20 @@ def update_tick(self, tick: InstigatorTick) -> InstigatorTick:
             tick (InstigatorTick): The tick to update
         """
 
+    def update_tick_and_instigator_state(
+        self, tick: InstigatorTick, state: InstigatorState
+    ) -> None:
+        """Update a tick and the state of its instigator in storage. The instigator state must
+        already be present in storage. Storages that can write both records in a single round trip
+        should override this.
+
+        Args:
+            tick (InstigatorTick): The tick to update
+            state (InstigatorState): The instigator state to update
+        """
+        self.update_tick(tick)
+        self.update_instigator_state(state)
+
     @abc.abstractmethod
     def purge_ticks(
         self,
@@ -162,6 +185,16 @@ def add_auto_materialize_asset_evaluations(
     ) -> None:
         """Add asset policy evaluations to storage."""
 
+    def update_auto_materialize_asset_evaluations(
+        self,
+        evaluation_id: int,
+        asset_evaluations: Sequence[AutomationConditionEvaluationWithRunIds],
+    ) -> None:
+        """Update asset policy evaluations that have already been added to storage, e.g. with the
+        ids of the runs that were launched for them.
+        """
+        self.add_auto_materialize_asset_evaluations(evaluation_id, asset_evaluations)
+
     @abc.abstractmethod
     def get_auto_materialize_asset_evaluations(
         self, asset_key: AssetKey, limit: int, cursor: Optional[int] = None
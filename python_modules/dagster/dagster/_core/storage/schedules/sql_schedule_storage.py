@@ -145,7 +145,9 @@ def _has_instigator_state_by_selector(self, selector_id: str) -> bool:
         rows = self.execute(query)
         return self._deserialize_rows(rows[:1])[0] if len(rows) else None  # type: ignore
 
-    def _add_or_update_instigators_table(self, conn: Connection, state: InstigatorState) -> None:
+    def _add_or_update_instigators_table(
+        self, conn: Connection, state: InstigatorState, instigator_body: str
+    ) -> None:
         selector_id = state.selector_id
         try:
             conn.execute(
@@ -154,7 +156,7 @@ def _add_or_update_instigators_table(self, conn: Connection, state: InstigatorSt
                     repository_selector_id=state.repository_selector_id,
                     status=state.status.value,
                     instigator_type=state.instigator_type.value,
-                    instigator_body=serialize_value(state),
+                    instigator_body=instigator_body,
                 )
             )
         except db_exc.IntegrityError:
@@ -164,13 +166,15 @@ def _add_or_update_instigators_table(self, conn: Connection, state: InstigatorSt
                 .values(
                     status=state.status.value,
                     instigator_type=state.instigator_type.value,
-                    instigator_body=serialize_value(state),
+                    instigator_body=instigator_body,
                     update_timestamp=get_current_datetime(),
                 )
             )
 
     def add_instigator_state(self, state: InstigatorState) -> InstigatorState:
         check.inst_param(state, "state", InstigatorState)
+        # the same serialized state is written to both the jobs and instigators tables
+        state_body = serialize_value(state)
         with self.connect() as conn:
             try:
                 conn.execute(
@@ -179,7 +183,7 @@ def add_instigator_state(self, state: InstigatorState) -> InstigatorState:
                         repository_origin_id=state.repository_origin_id,
                         status=state.status.value,
                         job_type=state.instigator_type.value,
-                        job_body=serialize_value(state),
+                        job_body=state_body,
                     )
                 )
             except db_exc.IntegrityError as exc:
@@ -189,10 +193,43 @@ def add_instigator_state(self, state: InstigatorState) -> InstigatorState:
 
             # try writing to the instigators table
             if self._has_instigators_table(conn):
-                self._add_or_update_instigators_table(conn, state)
+                self._add_or_update_instigators_table(conn, state, state_body)
 
         return state
 
+    def add_instigator_states(self, states: Sequence[InstigatorState]) -> Sequence[InstigatorState]:
+        check.sequence_param(states, "states", of_type=InstigatorState)
+        if not states:
+            return []
+
+        state_bodies = [serialize_value(state) for state in states]
+        with self.connect() as conn:
+            try:
+                conn.execute(
+                    JobTable.insert(),
+                    [
+                        dict(
+                            job_origin_id=state.instigator_origin_id,
+                            repository_origin_id=state.repository_origin_id,
+                            status=state.status.value,
+                            job_type=state.instigator_type.value,
+                            job_body=state_body,
+                        )
+                        for state, state_body in zip(states, state_bodies)
+                    ],
+                )
+            except db_exc.IntegrityError as exc:
+                raise DagsterInvariantViolationError(
+                    "One or more of the InstigatorStates are already present in storage"
+                ) from exc
+
+            # try writing to the instigators table
+            if self._has_instigators_table(conn):
+                for state, state_body in zip(states, state_bodies):
+                    self._add_or_update_instigators_table(conn, state, state_body)
+
+        return states
+
     def update_instigator_state(self, state: InstigatorState) -> InstigatorState:
         check.inst_param(state, "state", InstigatorState)
         if not self.get_instigator_state(state.instigator_origin_id, state.selector_id):
@@ -200,24 +237,29 @@ def update_instigator_state(self, state: InstigatorState) -> InstigatorState:
                 f"InstigatorState {state.instigator_origin_id} is not present in storage"
             )
 
+        with self.connect() as conn:
+            self._update_instigator_state(conn, state)
+
+        return state
+
+    def _update_instigator_state(self, conn: Connection, state: InstigatorState) -> None:
+        has_instigators_table = self._has_instigators_table(conn)
+        state_body = serialize_value(state)
         values = {
             "status": state.status.value,
-            "job_body": serialize_value(state),
+            "job_body": state_body,
             "update_timestamp": get_current_datetime(),
         }
-        if self.has_instigators_table():
+        if has_instigators_table:
             values["selector_id"] = state.selector_id
 
-        with self.connect() as conn:
-            conn.execute(
-                JobTable.update()
-                .where(JobTable.c.job_origin_id == state.instigator_origin_id)
-                .values(**values)
-            )
-            if self._has_instigators_table(conn):
-                self._add_or_update_instigators_table(conn, state)
-
-        return state
+        conn.execute(
+            JobTable.update()
+            .where(JobTable.c.job_origin_id == state.instigator_origin_id)
+            .values(**values)
+        )
+        if has_instigators_table:
+            self._add_or_update_instigators_table(conn, state, state_body)
 
     def delete_instigator_state(self, origin_id: str, selector_id: str) -> None:
         check.str_param(origin_id, "origin_id")
@@ -425,21 +467,38 @@ def create_tick(self, tick_data: TickData) -> InstigatorTick:
     def update_tick(self, tick: InstigatorTick) -> InstigatorTick:
         check.inst_param(tick, "tick", InstigatorTick)
 
+        with self.connect() as conn:
+            self._update_tick(conn, tick)
+
+        return tick
+
+    def _update_tick(self, conn: Connection, tick: InstigatorTick) -> None:
         values = {
             "status": tick.status.value,
             "type": tick.instigator_type.value,
             "timestamp": datetime_from_timestamp(tick.timestamp),
             "tick_body": serialize_value(tick.tick_data),
         }
-        if self.has_instigators_table() and tick.selector_id:
+        if tick.selector_id and self._has_instigators_table(conn):
             values["selector_id"] = tick.selector_id
 
-        with self.connect() as conn:
-            conn.execute(
-                JobTickTable.update().where(JobTickTable.c.id == tick.tick_id).values(**values)
-            )
+        conn.execute(
+            JobTickTable.update().where(JobTickTable.c.id == tick.tick_id).values(**values)
+        )
 
-        return tick
+    def update_tick_and_instigator_state(
+        self, tick: InstigatorTick, state: InstigatorState
+    ) -> None:
+        check.inst_param(tick, "tick", InstigatorTick)
+        check.inst_param(state, "state", InstigatorState)
+
+        # callers pass a state that they have just read from storage, so it is not looked up again
+        # here. write both records over a single connection. This is not atomic on every storage: the
+        # sqlite and mysql connections run in a transaction, but postgres connections autocommit
+        # each statement.
+        with self.connect() as conn:
+            self._update_tick(conn, tick)
+            self._update_instigator_state(conn, state)
 
     def purge_ticks(
         self,
@@ -519,6 +578,44 @@ def add_auto_materialize_asset_evaluations(
                         )
                     )
 
+    def update_auto_materialize_asset_evaluations(
+        self,
+        evaluation_id: int,
+        asset_evaluations: Sequence[AutomationConditionEvaluationWithRunIds],
+    ) -> None:
+        if not asset_evaluations:
+            return
+
+        # the evaluation rows already exist, so they are updated with a single executemany
+        # statement instead of attempting an insert for each of them first
+        update_stmt = (
+            AssetDaemonAssetEvaluationsTable.update()
+            .where(
+                db.and_(
+                    AssetDaemonAssetEvaluationsTable.c.evaluation_id
+                    == db.bindparam("b_evaluation_id"),
+                    AssetDaemonAssetEvaluationsTable.c.asset_key == db.bindparam("b_asset_key"),
+                )
+            )
+            .values(
+                asset_evaluation_body=db.bindparam("b_asset_evaluation_body"),
+                num_requested=db.bindparam("b_num_requested"),
+            )
+        )
+        with self.connect() as conn:
+            conn.execute(
+                update_stmt,
+                [
+                    {
+                        "b_evaluation_id": evaluation_id,
+                        "b_asset_key": evaluation.asset_key.to_string(),
+                        "b_asset_evaluation_body": serialize_value(evaluation),
+                        "b_num_requested": evaluation.num_requested,
+                    }
+                    for evaluation in asset_evaluations
+                ],
+            )
+
     def get_auto_materialize_asset_evaluations(
         self, asset_key: AssetKey, limit: int, cursor: Optional[int] = None
     ) -> Sequence[AutoMaterializeAssetEvaluationRecord]:
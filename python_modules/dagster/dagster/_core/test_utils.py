@@ -635,7 +635,8 @@ def wait_for_futures(futures: Dict[str, Future], timeout: Optional[float] = None
 
         if not future.done():
             results[target_id] = future.result(timeout=future_timeout)
-            del futures[target_id]
+            # futures may remove themselves from the dict upon completion
+            futures.pop(target_id, None)
 
     return results
 
@@ -294,6 +294,7 @@ def __init__(self, settings: Mapping[str, Any]) -> None:
         self._exit_stack = ExitStack()
         self._threadpool_executor: Optional[InheritContextThreadPoolExecutor] = None
         self._submit_threadpool_executor: Optional[InheritContextThreadPoolExecutor] = None
+        self._jitter_loop_interval = bool(settings.get("jitter_loop_interval"))
 
         if settings.get("use_threads"):
             self._threadpool_executor = self._exit_stack.enter_context(
@@ -330,6 +331,7 @@ def core_loop(
             shutdown_event,
             threadpool_executor=self._threadpool_executor,
             submit_threadpool_executor=self._submit_threadpool_executor,
+            jitter_loop_interval=self._jitter_loop_interval,
         )
 
 
@@ -1,21 +1,33 @@
 import datetime
 import logging
+import math
+import random
 import sys
 import threading
-from collections import defaultdict
+from collections import defaultdict, deque
 from concurrent.futures import Future, ThreadPoolExecutor
-from contextlib import AbstractContextManager
+from itertools import islice
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Deque,
     Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
     List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
+    TypeVar,
     Union,
     cast,
 )
@@ -33,6 +45,7 @@
     AddDynamicPartitionsRequest,
     DeleteDynamicPartitionsRequest,
 )
+from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.run_request import DagsterRunReaction, InstigatorType, RunRequest
 from dagster._core.definitions.selector import JobSubsetSelector
 from dagster._core.definitions.sensor_definition import DefaultSensorStatus
@@ -45,7 +58,11 @@
 from dagster._core.execution.backfill import PartitionBackfill
 from dagster._core.instance import DagsterInstance
 from dagster._core.remote_representation.code_location import CodeLocation
-from dagster._core.remote_representation.external import ExternalJob, ExternalSensor
+from dagster._core.remote_representation.external import (
+    ExternalExecutionPlan,
+    ExternalJob,
+    ExternalSensor,
+)
 from dagster._core.remote_representation.external_data import ExternalTargetData
 from dagster._core.scheduler.instigation import (
     DynamicPartitionsRequestResult,
@@ -59,11 +76,16 @@
 from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
 from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
-from dagster._core.utils import make_new_backfill_id, make_new_run_id
-from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._core.utils import (
+    FuturesAwareThreadPoolExecutor,
+    make_new_backfill_id,
+    make_new_run_id,
+)
+from dagster._core.workspace.context import BaseWorkspaceRequestContext, IWorkspaceProcessContext
+from dagster._core.workspace.workspace import CodeLocationEntry
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
-from dagster._time import get_current_datetime, get_current_timestamp
+from dagster._time import get_current_datetime, get_current_timestamp, get_monotonic_time
 from dagster._utils import DebugCrashFlags, SingleInstigatorDebugCrashFlags, check_for_debug_crash
 from dagster._utils.error import SerializableErrorInfo
 from dagster._utils.merger import merge_dicts
@@ -74,6 +96,10 @@
 
 MIN_INTERVAL_LOOP_TIME = 5
 
+# When the sensor loop interval is jittered, the largest fraction of the interval by which an
+# iteration may start earlier or later than it otherwise would
+LOOP_INTERVAL_JITTER_FRACTION = 0.5
+
 # When retrying a tick, how long to wait before ignoring it and moving on to the next one
 # (To account for the rare case where the daemon is down for a long time, starts back up, and
 # there's an old in-progress tick left to finish that may no longer be correct to finish)
@@ -83,6 +109,22 @@
 # before proceeding to the next tick
 MAX_FAILURE_RESUBMISSION_RETRIES = 1
 
+# How many sensor ticks may be queued or running on the worker pool per worker before further
+# sensors are deferred to a later iteration
+MAX_INFLIGHT_TICKS_PER_WORKER = 2
+
+# How many run requests may be submitted to the submit worker pool per worker at a time, rather
+# than submitting every run request of a tick up front
+MAX_INFLIGHT_RUN_REQUESTS_PER_WORKER = 2
+
+# How many run keys or run ids to look up in a single query when checking for runs that a sensor has
+# already requested
+RUN_KEY_FETCH_BATCH_SIZE = 50
+
+# How often the tick purges requested by finished sensor ticks are issued, so that the purges
+# requested for the same sensor across several iterations are coalesced into one
+TICK_PURGE_FLUSH_INTERVAL_SECONDS = 30
+
 FINISHED_TICK_STATES = [TickStatus.SKIPPED, TickStatus.SUCCESS, TickStatus.FAILURE]
 
 
@@ -103,23 +145,35 @@ class BackfillSubmission(NamedTuple):
     backfill_id: str
 
 
-class SensorLaunchContext(AbstractContextManager):
+class SensorLaunchContext:
+    # a launch context is created for every sensor tick, so its attributes are slotted rather than
+    # held in a per-instance dict
+    __slots__ = [
+        "_external_sensor",
+        "_instance",
+        "_logger",
+        "_tick",
+        "_tick_purge_coalescer",
+        "_should_update_cursor_on_failure",
+        "_purge_settings",
+    ]
+
     def __init__(
         self,
         external_sensor: ExternalSensor,
         tick: InstigatorTick,
         instance: DagsterInstance,
         logger: logging.Logger,
-        tick_retention_settings,
+        purge_settings: Sequence[Tuple[int, FrozenSet[TickStatus]]],
+        tick_purge_coalescer: Optional["TickPurgeCoalescer"] = None,
     ):
         self._external_sensor = external_sensor
         self._instance = instance
         self._logger = logger
         self._tick = tick
+        self._tick_purge_coalescer = tick_purge_coalescer
         self._should_update_cursor_on_failure = False
-        self._purge_settings = defaultdict(set)
-        for status, day_offset in tick_retention_settings.items():
-            self._purge_settings[day_offset].add(status)
+        self._purge_settings = purge_settings
 
     @property
     def status(self) -> TickStatus:
@@ -199,12 +253,15 @@ def set_run_requests(
             reserved_run_ids=reserved_run_ids,
             cursor=cursor,
         )
-        self._write()
+        # the reserved run ids are written before any run is submitted, so that an interrupted tick
+        # can be resumed. if there are no runs to reserve, there is nothing to resume, and the tick
+        # is written once it finishes
+        if run_requests:
+            self._write()
 
     def _write(self) -> None:
-        self._instance.update_tick(self._tick)
-
         if self._tick.status not in FINISHED_TICK_STATES:
+            self._instance.update_tick(self._tick)
             return
 
         should_update_cursor_and_last_run_key = (
@@ -217,6 +274,12 @@ def _write(self) -> None:
         state = self._instance.get_instigator_state(
             self._external_sensor.get_external_origin_id(), self._external_sensor.selector_id
         )
+        if state is None:
+            # the sensor state was removed while the tick was running. the finished tick is still
+            # recorded, but there is no state to update
+            self._instance.update_tick(self._tick)
+            return
+
         last_run_key = state.instigator_data.last_run_key if state.instigator_data else None  # type: ignore  # (possible none)
         last_sensor_start_timestamp = (
             state.instigator_data.last_sensor_start_timestamp if state.instigator_data else None  # type: ignore  # (possible none)
@@ -232,7 +295,9 @@ def _write(self) -> None:
             self._tick.timestamp,
             state.instigator_data.last_tick_start_timestamp or 0,  # type: ignore  # (possible none)
         )
-        self._instance.update_instigator_state(
+        # the finished tick and the sensor state are committed together in a single storage call
+        self._instance.update_tick_and_instigator_state(
+            self._tick,
             state.with_data(  # type: ignore  # (possible none)
                 SensorInstigatorData(
                     last_tick_timestamp=self._tick.timestamp,
@@ -244,9 +309,9 @@ def _write(self) -> None:
                     sensor_type=self._external_sensor.sensor_type,
                     last_tick_success_timestamp=None
                     if self._tick.status == TickStatus.FAILURE
-                    else get_current_datetime().timestamp(),
+                    else get_current_timestamp(),
                 )
-            )
+            ),
         )
 
     def __enter__(self) -> Self:
@@ -287,15 +352,149 @@ def __exit__(
 
         self._write()
 
-        for day_offset, statuses in self._purge_settings.items():
+        now = get_current_datetime()
+        for day_offset, statuses in self._purge_settings:
             if day_offset <= 0:
                 continue
-            self._instance.purge_ticks(
-                self._external_sensor.get_external_origin_id(),
-                selector_id=self._external_sensor.selector_id,
-                before=(get_current_datetime() - datetime.timedelta(days=day_offset)).timestamp(),
-                tick_statuses=list(statuses),
+            before = (now - datetime.timedelta(days=day_offset)).timestamp()
+            if self._tick_purge_coalescer:
+                # defer the purge so that it is issued off of the tick path
+                self._tick_purge_coalescer.schedule(
+                    self._external_sensor.get_external_origin_id(),
+                    self._external_sensor.selector_id,
+                    before,
+                    statuses,
+                )
+            else:
+                self._instance.purge_ticks(
+                    self._external_sensor.get_external_origin_id(),
+                    selector_id=self._external_sensor.selector_id,
+                    before=before,
+                    tick_statuses=list(statuses),
+                )
+
+
+def get_purge_settings(
+    tick_retention_settings: Mapping[TickStatus, int],
+) -> Sequence[Tuple[int, FrozenSet[TickStatus]]]:
+    """Groups the tick statuses to purge by their retention day offset."""
+    statuses_by_day_offset = defaultdict(set)
+    for status, day_offset in tick_retention_settings.items():
+        statuses_by_day_offset[day_offset].add(status)
+    return tuple(
+        (day_offset, frozenset(statuses)) for day_offset, statuses in statuses_by_day_offset.items()
+    )
+
+
+class TickPurgeCoalescer:
+    """Collects the tick purges requested by finished sensor ticks so that they can be issued at most
+    once per flush interval instead of on each tick's path. Purges requested for the same sensor
+    and set of tick statuses are coalesced, keeping the latest cutoff, since it supersedes earlier
+    ones.
+    """
+
+    def __init__(self, flush_interval: float = TICK_PURGE_FLUSH_INTERVAL_SECONDS):
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str, FrozenSet[TickStatus]], float] = {}
+        self._flush_interval = flush_interval
+        self._next_flush_time = get_monotonic_time() + flush_interval
+
+    def schedule(
+        self,
+        origin_id: str,
+        selector_id: str,
+        before: float,
+        tick_statuses: AbstractSet[TickStatus],
+    ) -> None:
+        key = (origin_id, selector_id, frozenset(tick_statuses))
+        with self._lock:
+            self._pending[key] = max(before, self._pending.get(key, before))
+
+    def flush_if_due(self, instance: DagsterInstance) -> Iterator[None]:
+        now = get_monotonic_time()
+        if now < self._next_flush_time:
+            return
+
+        self._next_flush_time = now + self._flush_interval
+        yield from self.flush(instance)
+
+    def flush(self, instance: DagsterInstance) -> Iterator[None]:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        for (origin_id, selector_id, tick_statuses), before in pending.items():
+            instance.purge_ticks(
+                origin_id,
+                selector_id=selector_id,
+                before=before,
+                tick_statuses=list(tick_statuses),
             )
+            # yield between purges so that the daemon can heartbeat
+            yield
+
+
+class SensorEnumerationCache:
+    """Caches the sensors enumerated from each code location, keyed by the update timestamp of the
+    location entry, so that code locations that have not changed between sensor daemon iterations
+    are not re-enumerated.
+    """
+
+    def __init__(self):
+        self._sensors_by_location: Dict[str, Tuple[float, Sequence[ExternalSensor]]] = {}
+
+    def get_sensors(
+        self, workspace_snapshot: Mapping[str, CodeLocationEntry]
+    ) -> Sequence[ExternalSensor]:
+        # drop entries for code locations that were removed from the workspace
+        for location_name in list(self._sensors_by_location.keys()):
+            if location_name not in workspace_snapshot:
+                del self._sensors_by_location[location_name]
+
+        sensors: List[ExternalSensor] = []
+        for location_name, location_entry in workspace_snapshot.items():
+            cached = self._sensors_by_location.get(location_name)
+            if cached and cached[0] == location_entry.update_timestamp:
+                location_sensors = cached[1]
+            else:
+                location_sensors = _get_location_sensors(location_entry)
+                self._sensors_by_location[location_name] = (
+                    location_entry.update_timestamp,
+                    location_sensors,
+                )
+            sensors.extend(location_sensors)
+        return sensors
+
+
+class SensorEligibilityCache:
+    """Tracks the earliest time at which any running sensor will next be eligible for evaluation,
+    as of the last full pass over the workspace. While neither the code locations nor the stored
+    sensor statuses have changed since that pass, iterations before that time can return without
+    visiting every sensor.
+    """
+
+    def __init__(self):
+        self._fingerprint: Optional[Hashable] = None
+        self._next_eligible_timestamp = math.inf
+
+    def can_skip(self, fingerprint: Hashable, now: float) -> bool:
+        return fingerprint == self._fingerprint and now < self._next_eligible_timestamp
+
+    def update(self, fingerprint: Hashable, next_eligible_timestamp: float) -> None:
+        self._fingerprint = fingerprint
+        self._next_eligible_timestamp = next_eligible_timestamp
+
+
+def _get_location_sensors(location_entry: CodeLocationEntry) -> Sequence[ExternalSensor]:
+    code_location = location_entry.code_location
+    if not code_location:
+        return []
+
+    return [
+        sensor
+        for repo in code_location.get_repositories().values()
+        for sensor in repo.get_external_sensors()
+        if not sensor.sensor_type.is_handled_by_asset_daemon
+    ]
 
 
 def execute_sensor_iteration_loop(
@@ -305,21 +504,40 @@ def execute_sensor_iteration_loop(
     until: Optional[float] = None,
     threadpool_executor: Optional[ThreadPoolExecutor] = None,
     submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    jitter_loop_interval: bool = False,
 ) -> "DaemonIterator":
     """Helper function that performs sensor evaluations on a tighter loop, while reusing grpc locations
     within a given daemon interval.  Rather than relying on the daemon machinery to run the
     iteration loop every 30 seconds, sensors are continuously evaluated, every 5 seconds. We rely on
     each sensor definition's min_interval to check that sensor evaluations are spaced appropriately.
+
+    If jitter_loop_interval is set, the interval between iterations is randomized around its usual
+    length, so that multiple sensor daemons do not hit shared code servers and storage in
+    synchronized bursts, without changing how often each daemon iterates on average.
     """
     from dagster._daemon.daemon import SpanMarker
 
     sensor_tick_futures: Dict[str, Future] = {}
+    sensor_enumeration_cache = SensorEnumerationCache()
+    tick_purge_coalescer = TickPurgeCoalescer()
+    sensor_eligibility_cache = SensorEligibilityCache()
+    next_iteration_deadline = get_monotonic_time()
     while True:
         start_time = get_current_timestamp()
         if until and start_time >= until:
             # provide a way of organically ending the loop to support test environment
             break
 
+        loop_interval = MIN_INTERVAL_LOOP_TIME
+        if jitter_loop_interval:
+            loop_interval *= 1 + random.uniform(
+                -LOOP_INTERVAL_JITTER_FRACTION, LOOP_INTERVAL_JITTER_FRACTION
+            )
+
+        # pace iterations on the monotonic clock at a fixed cadence. If the previous iteration ran
+        # past its deadline, restart the cadence from now instead of bursting to catch up.
+        next_iteration_deadline = max(next_iteration_deadline, get_monotonic_time()) + loop_interval
+
         yield SpanMarker.START_SPAN
 
         try:
@@ -329,7 +547,13 @@ def execute_sensor_iteration_loop(
                 threadpool_executor=threadpool_executor,
                 submit_threadpool_executor=submit_threadpool_executor,
                 sensor_tick_futures=sensor_tick_futures,
+                sensor_enumeration_cache=sensor_enumeration_cache,
+                tick_purge_coalescer=tick_purge_coalescer,
+                sensor_eligibility_cache=sensor_eligibility_cache,
             )
+            # issue the purges requested by ticks that have finished, once the flush interval has
+            # elapsed
+            yield from tick_purge_coalescer.flush_if_due(workspace_process_context.instance)
         except Exception:
             error_info = DaemonErrorCapture.on_exception(
                 exc_info=sys.exc_info(),
@@ -341,10 +565,7 @@ def execute_sensor_iteration_loop(
         # execute_sensor_iteration
         yield SpanMarker.END_SPAN
 
-        end_time = get_current_timestamp()
-
-        loop_duration = end_time - start_time
-        sleep_time = max(0, MIN_INTERVAL_LOOP_TIME - loop_duration)
+        sleep_time = max(0, next_iteration_deadline - get_monotonic_time())
         shutdown_event.wait(sleep_time)
 
         yield None
@@ -357,6 +578,9 @@ def execute_sensor_iteration(
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     sensor_tick_futures: Optional[Dict[str, Future]] = None,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
+    sensor_enumeration_cache: Optional[SensorEnumerationCache] = None,
+    tick_purge_coalescer: Optional[TickPurgeCoalescer] = None,
+    sensor_eligibility_cache: Optional[SensorEligibilityCache] = None,
 ):
     instance = workspace_process_context.instance
 
@@ -370,38 +594,64 @@ def execute_sensor_iteration(
     all_sensor_states = {
         sensor_state.selector_id: sensor_state
         for sensor_state in instance.all_instigator_state(instigator_type=InstigatorType.SENSOR)
-        if not (  # filter out sensors state handled by asset daemon
-            sensor_state.sensor_instigator_data
-            and sensor_state.sensor_instigator_data.sensor_type
-            and sensor_state.sensor_instigator_data.sensor_type.is_handled_by_asset_daemon
-        )
+        # filter out sensors state handled by asset daemon
+        if not _is_handled_by_asset_daemon(sensor_state)
     }
 
-    tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
+    # any change to the code locations or to the stored sensor statuses can make a sensor eligible
+    # that was not eligible during the last full pass
+    eligibility_fingerprint = (
+        tuple(
+            (location_name, location_entry.update_timestamp)
+            for location_name, location_entry in workspace_snapshot.items()
+        ),
+        frozenset(
+            (selector_id, sensor_state.status)
+            for selector_id, sensor_state in all_sensor_states.items()
+        ),
+    )
+    now = get_current_timestamp()
+    if sensor_eligibility_cache and sensor_eligibility_cache.can_skip(eligibility_fingerprint, now):
+        yield
+        return
+
+    purge_settings = get_purge_settings(instance.get_tick_retention_settings(InstigatorType.SENSOR))
+
+    if sensor_enumeration_cache is None:
+        sensor_enumeration_cache = SensorEnumerationCache()
 
     sensors: Dict[str, ExternalSensor] = {}
-    for location_entry in workspace_snapshot.values():
-        code_location = location_entry.code_location
-        if code_location:
-            for repo in code_location.get_repositories().values():
-                for sensor in repo.get_external_sensors():
-                    if sensor.sensor_type.is_handled_by_asset_daemon:
-                        continue
-
-                    selector_id = sensor.selector_id
-                    if sensor.get_current_instigator_state(
-                        all_sensor_states.get(selector_id)
-                    ).is_running:
-                        sensors[selector_id] = sensor
+    for sensor in sensor_enumeration_cache.get_sensors(workspace_snapshot):
+        selector_id = sensor.selector_id
+        if sensor.get_current_instigator_state(all_sensor_states.get(selector_id)).is_running:
+            sensors[selector_id] = sensor
+
+    # the earliest time at which a sensor that is skipped in this pass becomes eligible again.
+    # sensors that are in flight or evaluated in this pass are treated as eligible immediately
+    next_eligible_timestamp = math.inf
 
     if not sensors:
+        if sensor_eligibility_cache:
+            sensor_eligibility_cache.update(eligibility_fingerprint, next_eligible_timestamp)
         yield
         return
 
+    sensors_to_evaluate: List[Tuple[ExternalSensor, InstigatorState]] = []
+    new_sensor_states: List[InstigatorState] = []
     for external_sensor in sensors.values():
-        sensor_name = external_sensor.name
-        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
-        sensor_state = all_sensor_states.get(external_sensor.selector_id)
+        selector_id = external_sensor.selector_id
+
+        if threadpool_executor:
+            if sensor_tick_futures is None:
+                check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
+
+            # only allow one tick per sensor to be in flight. futures are removed from
+            # sensor_tick_futures as soon as they complete, so membership means in flight
+            if selector_id in sensor_tick_futures:
+                next_eligible_timestamp = now
+                continue
+
+        sensor_state = all_sensor_states.get(selector_id)
         if not sensor_state:
             assert external_sensor.default_status == DefaultSensorStatus.RUNNING
             sensor_state = InstigatorState(
@@ -410,36 +660,70 @@ def execute_sensor_iteration(
                 InstigatorStatus.DECLARED_IN_CODE,
                 SensorInstigatorData(
                     min_interval=external_sensor.min_interval_seconds,
-                    last_sensor_start_timestamp=get_current_timestamp(),
+                    last_sensor_start_timestamp=now,
                     sensor_type=external_sensor.sensor_type,
                 ),
             )
-            instance.add_instigator_state(sensor_state)
-        elif is_under_min_interval(sensor_state, external_sensor):
-            continue
+            new_sensor_states.append(sensor_state)
+        else:
+            sensor_next_eligible_timestamp = _get_next_eligible_timestamp(
+                sensor_state, external_sensor
+            )
+            if sensor_next_eligible_timestamp is not None and now < sensor_next_eligible_timestamp:
+                next_eligible_timestamp = min(
+                    next_eligible_timestamp, sensor_next_eligible_timestamp
+                )
+                continue
 
-        if threadpool_executor:
-            if sensor_tick_futures is None:
-                check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
+        next_eligible_timestamp = now
+        sensors_to_evaluate.append((external_sensor, sensor_state))
 
-            # only allow one tick per sensor to be in flight
-            if (
-                external_sensor.selector_id in sensor_tick_futures
-                and not sensor_tick_futures[external_sensor.selector_id].done()
-            ):
-                continue
+    # states for running sensors that have no stored state yet are added in a single call
+    if new_sensor_states:
+        instance.add_instigator_states(new_sensor_states)
+
+    if isinstance(threadpool_executor, FuturesAwareThreadPoolExecutor):
+        sensors_to_evaluate = _limit_sensor_tick_submissions(
+            logger,
+            sensors_to_evaluate,
+            max_inflight_ticks=threadpool_executor.max_workers * MAX_INFLIGHT_TICKS_PER_WORKER,
+            num_inflight_ticks=len(check.not_none(sensor_tick_futures)),
+        )
+
+    # sensors whose last tick did not succeed may have been interrupted, and need their latest tick
+    # to decide whether to resume it
+    prefetched_latest_ticks = _fetch_latest_ticks(
+        instance,
+        [
+            external_sensor.selector_id
+            for external_sensor, sensor_state in sensors_to_evaluate
+            if not _has_last_tick_succeeded(sensor_state)
+        ],
+    )
+
+    for external_sensor, _ in sensors_to_evaluate:
+        sensor_name = external_sensor.name
+        selector_id = external_sensor.selector_id
+        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
 
+        if threadpool_executor:
             future = threadpool_executor.submit(
                 _process_tick,
                 workspace_process_context,
                 logger,
                 external_sensor,
-                sensor_state,
                 sensor_debug_crash_flags,
-                tick_retention_settings,
+                purge_settings,
                 submit_threadpool_executor,
+                tick_purge_coalescer,
+                prefetched_latest_ticks,
+            )
+            check.not_none(sensor_tick_futures)[selector_id] = future
+            future.add_done_callback(
+                lambda f, selector_id=selector_id: _discard_sensor_tick_future(
+                    check.not_none(sensor_tick_futures), selector_id, f
+                )
             )
-            sensor_tick_futures[external_sensor.selector_id] = future
             yield
 
         else:
@@ -449,21 +733,91 @@ def execute_sensor_iteration(
                 workspace_process_context,
                 logger,
                 external_sensor,
-                sensor_state,
                 sensor_debug_crash_flags,
-                tick_retention_settings,
+                purge_settings,
                 submit_threadpool_executor=None,
+                tick_purge_coalescer=tick_purge_coalescer,
+                prefetched_latest_ticks=prefetched_latest_ticks,
             )
 
+    if sensor_eligibility_cache:
+        sensor_eligibility_cache.update(eligibility_fingerprint, next_eligible_timestamp)
+
+
+def _is_handled_by_asset_daemon(sensor_state: InstigatorState) -> bool:
+    instigator_data = sensor_state.instigator_data
+    return (
+        isinstance(instigator_data, SensorInstigatorData)
+        and instigator_data.sensor_type is not None
+        and instigator_data.sensor_type.is_handled_by_asset_daemon
+    )
+
+
+def _limit_sensor_tick_submissions(
+    logger: logging.Logger,
+    sensors_to_evaluate: Sequence[Tuple[ExternalSensor, InstigatorState]],
+    max_inflight_ticks: int,
+    num_inflight_ticks: int,
+) -> List[Tuple[ExternalSensor, InstigatorState]]:
+    """Bounds the number of sensor ticks queued on the worker pool. If the pool is saturated, the
+    sensors that have gone the longest without starting a tick are submitted first, and the rest
+    are deferred to a later iteration.
+    """
+    num_available = max(0, max_inflight_ticks - num_inflight_ticks)
+    if len(sensors_to_evaluate) <= num_available:
+        return list(sensors_to_evaluate)
+
+    logger.warning(
+        f"{num_inflight_ticks} sensor ticks are already in flight, deferring"
+        f" {len(sensors_to_evaluate) - num_available} sensors to the next iteration. Consider"
+        " increasing the number of sensor daemon workers."
+    )
+
+    def _last_tick_start_timestamp(sensor_and_state: Tuple[ExternalSensor, InstigatorState]):
+        instigator_data = _sensor_instigator_data(sensor_and_state[1])
+        return (instigator_data.last_tick_start_timestamp if instigator_data else None) or 0
+
+    return sorted(sensors_to_evaluate, key=_last_tick_start_timestamp)[:num_available]
+
+
+def _has_last_tick_succeeded(sensor_state: InstigatorState) -> bool:
+    instigator_data = _sensor_instigator_data(sensor_state)
+    return bool(instigator_data and instigator_data.last_tick_success_timestamp)
+
+
+def _fetch_latest_ticks(
+    instance: DagsterInstance, selector_ids: Sequence[str]
+) -> Mapping[str, Optional[InstigatorTick]]:
+    """Fetches the latest tick of each of the given sensors in a single query. Sensors missing
+    from the returned mapping fetch their latest tick individually, which is the case for all
+    sensors if the storage does not support batch tick queries.
+    """
+    if len(selector_ids) < 2 or not instance.supports_batch_tick_queries:
+        return {}
+
+    ticks_by_selector_id = instance.get_batch_ticks(selector_ids, limit=1)
+    return {
+        selector_id: next(iter(ticks_by_selector_id.get(selector_id, [])), None)
+        for selector_id in selector_ids
+    }
+
+
+def _discard_sensor_tick_future(
+    sensor_tick_futures: Dict[str, Future], selector_id: str, future: Future
+) -> None:
+    if sensor_tick_futures.get(selector_id) is future:
+        sensor_tick_futures.pop(selector_id, None)
+
 
 def _process_tick(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
     external_sensor: ExternalSensor,
-    sensor_state: InstigatorState,
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
-    tick_retention_settings,
+    purge_settings: Sequence[Tuple[int, FrozenSet[TickStatus]]],
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    tick_purge_coalescer: Optional[TickPurgeCoalescer] = None,
+    prefetched_latest_ticks: Optional[Mapping[str, Optional[InstigatorTick]]] = None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -472,10 +826,11 @@ def _process_tick(
             workspace_process_context,
             logger,
             external_sensor,
-            sensor_state,
             sensor_debug_crash_flags,
-            tick_retention_settings,
+            purge_settings,
             submit_threadpool_executor,
+            tick_purge_coalescer,
+            prefetched_latest_ticks,
         )
     )
 
@@ -486,17 +841,20 @@ def _get_evaluation_tick(
     instigator_data: Optional[SensorInstigatorData],
     evaluation_timestamp: float,
     logger: logging.Logger,
+    prefetched_latest_ticks: Optional[Mapping[str, Optional[InstigatorTick]]] = None,
 ) -> InstigatorTick:
     """Returns the current tick that the sensor should evaluate for. If there is unfinished work
     from the previous tick that must be resolved before proceeding, will return that previous tick.
     """
     origin_id = sensor.get_external_origin_id()
-    selector_id = sensor.get_external_origin().get_selector().get_id()
+    selector_id = sensor.selector_id
 
     if instigator_data and instigator_data.last_tick_success_timestamp:
         # if a last tick end timestamp was set, then the previous tick could not have been
         # interrupted, so there is no need to fetch the previous tick
         potentially_interrupted_tick = None
+    elif prefetched_latest_ticks is not None and selector_id in prefetched_latest_ticks:
+        potentially_interrupted_tick = prefetched_latest_ticks[selector_id]
     else:
         potentially_interrupted_tick = next(
             iter(instance.get_ticks(origin_id, selector_id, limit=1)), None
@@ -562,24 +920,31 @@ def _process_tick_generator(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
     external_sensor: ExternalSensor,
-    sensor_state: InstigatorState,
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
-    tick_retention_settings,
+    purge_settings: Sequence[Tuple[int, FrozenSet[TickStatus]]],
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    tick_purge_coalescer: Optional[TickPurgeCoalescer] = None,
+    prefetched_latest_ticks: Optional[Mapping[str, Optional[InstigatorTick]]] = None,
 ):
     instance = workspace_process_context.instance
     error_info = None
     now = get_current_datetime()
-    sensor_state = check.not_none(
-        instance.get_instigator_state(
-            external_sensor.get_external_origin_id(), external_sensor.selector_id
-        )
+    # read the state when the tick starts rather than using the iteration's snapshot, since the
+    # tick may have been queued behind other work, and the sensor may have been stopped or had its
+    # cursor changed outside of the daemon in the meantime
+    sensor_state = instance.get_instigator_state(
+        external_sensor.get_external_origin_id(), external_sensor.selector_id
     )
+    if (
+        sensor_state is None
+        or not external_sensor.get_current_instigator_state(sensor_state).is_running
+    ):
+        return
     if is_under_min_interval(sensor_state, external_sensor):
         # check the since we might have been queued before processing
         return
-    else:
-        mark_sensor_state_for_tick(instance, external_sensor, sensor_state, now)
+
+    mark_sensor_state_for_tick(instance, external_sensor, sensor_state, now)
 
     try:
         # get the tick that we should be evaluating for
@@ -589,6 +954,7 @@ def _process_tick_generator(
             _sensor_instigator_data(sensor_state),
             now.timestamp(),
             logger,
+            prefetched_latest_ticks,
         )
 
         check_for_debug_crash(sensor_debug_crash_flags, "TICK_CREATED")
@@ -598,7 +964,8 @@ def _process_tick_generator(
             tick,
             instance,
             logger,
-            tick_retention_settings,
+            purge_settings,
+            tick_purge_coalescer,
         ) as tick_context:
             check_for_debug_crash(sensor_debug_crash_flags, "TICK_HELD")
             tick_context.add_log_key(tick_context.log_key)
@@ -680,8 +1047,12 @@ def _submit_run_request(
     workspace_process_context: IWorkspaceProcessContext,
     external_sensor: ExternalSensor,
     existing_runs_by_key,
+    existing_runs_by_id,
     logger,
     sensor_debug_crash_flags,
+    sensor_tags: Mapping[str, str],
+    job_tags_by_name: Dict[str, Mapping[str, str]],
+    execution_plans_by_key: Dict[Tuple[str, str], ExternalExecutionPlan],
 ) -> SubmitRunRequestResult:
     instance = workspace_process_context.instance
 
@@ -694,7 +1065,9 @@ def _submit_run_request(
     # reload the code_location on each submission, request_context derived data can become out date
     # * non-threaded: if number of serial submissions is too many
     # * threaded: if thread sits pending in pool too long
-    code_location = _get_code_location_for_sensor(workspace_process_context, external_sensor)
+    # the same request context is used to both create and launch the run
+    request_context = workspace_process_context.create_request_context()
+    code_location = _get_code_location_for_sensor(request_context, external_sensor)
     job_subset_selector = JobSubsetSelector(
         location_name=code_location.name,
         repository_name=sensor_origin.repository_origin.repository_name,
@@ -714,6 +1087,10 @@ def _submit_run_request(
         run_request,
         target_data,
         existing_runs_by_key,
+        existing_runs_by_id,
+        sensor_tags,
+        job_tags_by_name,
+        execution_plans_by_key,
     )
 
     if isinstance(run, SkippedSensorRun):
@@ -724,7 +1101,7 @@ def _submit_run_request(
     error_info = None
     try:
         logger.info(f"Launching run for {external_sensor.name}")
-        instance.submit_run(run.run_id, workspace_process_context.create_request_context())
+        instance.submit_run(run.run_id, request_context)
         logger.info(f"Completed launch of run {run.run_id} for {external_sensor.name}")
     except Exception:
         error_info = DaemonErrorCapture.on_exception(
@@ -762,7 +1139,8 @@ def _resume_tick(
 
     yield from _submit_run_requests(
         tick.unsubmitted_run_ids_with_requests,
-        evaluations,
+        {evaluation.asset_key: evaluation for evaluation in evaluations},
+        tick.tick_id,
         instance=instance,
         context=context,
         external_sensor=external_sensor,
@@ -774,11 +1152,11 @@ def _resume_tick(
 
 
 def _get_code_location_for_sensor(
-    workspace_process_context: IWorkspaceProcessContext,
+    request_context: BaseWorkspaceRequestContext,
     external_sensor: ExternalSensor,
 ) -> CodeLocation:
     sensor_origin = external_sensor.get_external_origin()
-    return workspace_process_context.create_request_context().get_code_location(
+    return request_context.get_code_location(
         sensor_origin.repository_origin.code_location_origin.location_name
     )
 
@@ -793,7 +1171,9 @@ def _evaluate_sensor(
 ):
     instance = workspace_process_context.instance
     context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
-    code_location = _get_code_location_for_sensor(workspace_process_context, external_sensor)
+    code_location = _get_code_location_for_sensor(
+        workspace_process_context.create_request_context(), external_sensor
+    )
     repository_handle = external_sensor.handle.repository_handle
     instigator_data = _sensor_instigator_data(state)
 
@@ -877,10 +1257,13 @@ def _handle_dynamic_partitions_requests(
     context: SensorLaunchContext,
 ) -> None:
     for request in dynamic_partitions_requests:
+        existing_partition_keys = instance.get_existing_dynamic_partitions(
+            request.partitions_def_name, request.partition_keys
+        )
         existent_partitions = []
         nonexistent_partitions = []
         for partition_key in request.partition_keys:
-            if instance.has_dynamic_partition(request.partitions_def_name, partition_key):
+            if partition_key in existing_partition_keys:
                 existent_partitions.append(partition_key)
             else:
                 nonexistent_partitions.append(partition_key)
@@ -913,9 +1296,7 @@ def _handle_dynamic_partitions_requests(
             )
         elif isinstance(request, DeleteDynamicPartitionsRequest):
             if existent_partitions:
-                # TODO add a bulk delete method to the instance
-                for partition in existent_partitions:
-                    instance.delete_dynamic_partition(request.partitions_def_name, partition)
+                instance.delete_dynamic_partitions(request.partitions_def_name, existent_partitions)
 
                 context.logger.info(
                     "Deleted partition keys from dynamic partitions definition"
@@ -991,33 +1372,56 @@ def _resolve_run_requests(
     context: SensorLaunchContext,
     external_sensor: ExternalSensor,
     run_ids_with_requests: Sequence[Tuple[str, RunRequest]],
+    submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
 ) -> Sequence[Tuple[str, RunRequest]]:
-    resolved_run_ids_with_requests = []
+    tick_tags = DagsterRun.tags_for_tick_id(context.tick_id)
+    run_ids_with_tagged_requests = [
+        (
+            run_id,
+            raw_run_request.with_replaced_attrs(tags=merge_dicts(raw_run_request.tags, tick_tags)),
+        )
+        for run_id, raw_run_request in run_ids_with_requests
+    ]
 
-    for run_id, raw_run_request in run_ids_with_requests:
-        run_request = raw_run_request.with_replaced_attrs(
-            tags=merge_dicts(
-                raw_run_request.tags,
-                DagsterRun.tags_for_tick_id(context.tick_id),
-            )
+    def resolve_stale_assets(run_request: RunRequest) -> Sequence[AssetKey]:
+        return resolve_stale_or_missing_assets(
+            workspace_process_context,  # type: ignore
+            run_request,
+            external_sensor,
         )
 
-        if run_request.stale_assets_only:
-            stale_assets = resolve_stale_or_missing_assets(
-                workspace_process_context,  # type: ignore
-                run_request,
-                external_sensor,
-            )
-            # asset selection is empty set after filtering for stale
-            if len(stale_assets) == 0:
-                continue
-            else:
-                run_request = run_request.with_replaced_attrs(
-                    asset_selection=stale_assets, stale_assets_only=False
-                )
+    # resolving stale assets queries storage for each run request, so the run requests are
+    # resolved concurrently when a threadpool is available
+    stale_run_requests = [
+        run_request
+        for _, run_request in run_ids_with_tagged_requests
+        if run_request.stale_assets_only
+    ]
+    if submit_threadpool_executor and len(stale_run_requests) > 1:
+        gen_stale_assets = submit_threadpool_executor.map(resolve_stale_assets, stale_run_requests)
+    else:
+        gen_stale_assets = map(resolve_stale_assets, stale_run_requests)
+
+    def resolve_run_request(
+        run_id_with_request: Tuple[str, RunRequest],
+    ) -> Optional[Tuple[str, RunRequest]]:
+        run_id, run_request = run_id_with_request
+        if not run_request.stale_assets_only:
+            return run_id_with_request
+
+        stale_assets = next(gen_stale_assets)
+        # asset selection is empty set after filtering for stale
+        if not stale_assets:
+            return None
+        return run_id, run_request.with_replaced_attrs(
+            asset_selection=stale_assets, stale_assets_only=False
+        )
 
-        resolved_run_ids_with_requests.append((run_id, run_request))
-    return resolved_run_ids_with_requests
+    return [
+        resolved
+        for resolved in map(resolve_run_request, run_ids_with_tagged_requests)
+        if resolved is not None
+    ]
 
 
 def _handle_run_requests_and_automation_condition_evaluations(
@@ -1031,16 +1435,21 @@ def _handle_run_requests_and_automation_condition_evaluations(
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags] = None,
 ):
+    # the tick id doubles as the evaluation id of the automation condition evaluations
+    evaluation_id = int(context.tick_id)
+
     # first, write out any evaluations without any run ids
-    evaluations = [
-        evaluation.with_run_ids(set()) for evaluation in automation_condition_evaluations
-    ]
+    evaluations_by_asset_key = {
+        evaluation.asset_key: evaluation.with_run_ids(set())
+        for evaluation in automation_condition_evaluations
+    }
     if (
         instance.schedule_storage
         and instance.schedule_storage.supports_auto_materialize_asset_evaluations
     ):
         instance.schedule_storage.add_auto_materialize_asset_evaluations(
-            evaluation_id=int(context.tick_id), asset_evaluations=evaluations
+            evaluation_id=evaluation_id,
+            asset_evaluations=list(evaluations_by_asset_key.values()),
         )
 
     check_for_debug_crash(sensor_debug_crash_flags, "AUTOMATION_EVALUATIONS_ADDED")
@@ -1064,7 +1473,8 @@ def reserved_run_id(run_request: RunRequest) -> str:
     run_ids_with_run_requests = list(zip(reserved_run_ids, raw_run_requests))
     yield from _submit_run_requests(
         run_ids_with_run_requests,
-        evaluations,
+        evaluations_by_asset_key,
+        evaluation_id,
         instance,
         context,
         external_sensor,
@@ -1076,7 +1486,8 @@ def reserved_run_id(run_request: RunRequest) -> str:
 
 def _submit_run_requests(
     raw_run_ids_with_requests: Sequence[Tuple[str, RunRequest]],
-    automation_condition_evaluations: Sequence[AutomationConditionEvaluationWithRunIds],
+    evaluations_by_asset_key: Mapping[AssetKey, AutomationConditionEvaluationWithRunIds],
+    evaluation_id: int,
     instance: DagsterInstance,
     context: SensorLaunchContext,
     external_sensor: ExternalSensor,
@@ -1085,11 +1496,35 @@ def _submit_run_requests(
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags] = None,
 ):
     resolved_run_ids_with_requests = _resolve_run_requests(
-        workspace_process_context, context, external_sensor, raw_run_ids_with_requests
+        workspace_process_context,
+        context,
+        external_sensor,
+        raw_run_ids_with_requests,
+        submit_threadpool_executor,
+    )
+    # most sensors never set run keys, in which case there are no existing runs to look up
+    existing_runs_by_key = (
+        _fetch_existing_runs(
+            instance, external_sensor, [request for _, request in resolved_run_ids_with_requests]
+        )
+        if any(request.run_key for _, request in resolved_run_ids_with_requests)
+        else {}
     )
-    existing_runs_by_key = _fetch_existing_runs(
-        instance, external_sensor, [request for _, request in resolved_run_ids_with_requests]
+    existing_runs_by_id = _fetch_existing_runs_by_id(
+        instance,
+        [
+            run_id
+            for run_id, request in resolved_run_ids_with_requests
+            if not request.requires_backfill_daemon()
+        ],
     )
+    # the tags contributed by the sensor and by its target jobs are the same for every run
+    # requested by the tick, so they are built once per tick
+    sensor_tags = DagsterRun.tags_for_sensor(external_sensor)
+    job_tags_by_name: Dict[str, Mapping[str, str]] = {}
+    # execution plans fetched from the code location for the runs of this tick, keyed by job
+    # snapshot id and run config
+    execution_plans_by_key: Dict[Tuple[str, str], ExternalExecutionPlan] = {}
 
     def submit_run_request(
         run_id_with_run_request: Tuple[str, RunRequest],
@@ -1104,11 +1539,23 @@ def submit_run_request(
                 workspace_process_context,
                 external_sensor,
                 existing_runs_by_key,
+                existing_runs_by_id,
                 context.logger,
                 sensor_debug_crash_flags,
+                sensor_tags,
+                job_tags_by_name,
+                execution_plans_by_key,
             )
 
-    if submit_threadpool_executor:
+    if isinstance(submit_threadpool_executor, FuturesAwareThreadPoolExecutor):
+        gen_run_request_results = _map_with_bounded_prefetch(
+            submit_threadpool_executor,
+            submit_run_request,
+            resolved_run_ids_with_requests,
+            max_inflight=MAX_INFLIGHT_RUN_REQUESTS_PER_WORKER
+            * submit_threadpool_executor.max_workers,
+        )
+    elif submit_threadpool_executor:
         gen_run_request_results = submit_threadpool_executor.map(
             submit_run_request, resolved_run_ids_with_requests
         )
@@ -1116,15 +1563,12 @@ def submit_run_request(
         gen_run_request_results = map(submit_run_request, resolved_run_ids_with_requests)
 
     skipped_runs: List[SkippedSensorRun] = []
-    evaluations_by_asset_key = {
-        evaluation.asset_key: evaluation for evaluation in automation_condition_evaluations
-    }
-    updated_evaluation_keys = set()
+    # run ids are collected per asset key and applied to the evaluations once all runs are submitted
+    run_ids_by_evaluation_key: Dict[AssetKey, Set[str]] = defaultdict(set)
     for run_request_result in gen_run_request_results:
         yield run_request_result.error_info
 
         run = run_request_result.run
-        asset_keys = set()
 
         if isinstance(run, SkippedSensorRun):
             skipped_runs.append(run)
@@ -1133,28 +1577,29 @@ def submit_run_request(
             context.add_run_info(run_id=run.backfill_id)
         else:
             context.add_run_info(run_id=run.run_id, run_key=run_request_result.run_key)
-            asset_keys = run.asset_selection or set()
-            for key in asset_keys:
-                if key in evaluations_by_asset_key:
-                    evaluation = evaluations_by_asset_key[key]
-                    evaluations_by_asset_key[key] = evaluation._replace(
-                        run_ids=evaluation.run_ids | {run.run_id}
-                    )
-                    updated_evaluation_keys.add(key)
+            if run.asset_selection:
+                for key in evaluations_by_asset_key.keys() & run.asset_selection:
+                    run_ids_by_evaluation_key[key].add(run.run_id)
 
     if (
-        updated_evaluation_keys
+        run_ids_by_evaluation_key
         and instance.schedule_storage
         and instance.schedule_storage.supports_auto_materialize_asset_evaluations
     ):
-        instance.schedule_storage.add_auto_materialize_asset_evaluations(
-            evaluation_id=int(context.tick_id),
-            asset_evaluations=[evaluations_by_asset_key[key] for key in updated_evaluation_keys],
+        instance.schedule_storage.update_auto_materialize_asset_evaluations(
+            evaluation_id=evaluation_id,
+            asset_evaluations=[
+                evaluations_by_asset_key[key]._replace(
+                    run_ids=evaluations_by_asset_key[key].run_ids | run_ids
+                )
+                for key, run_ids in run_ids_by_evaluation_key.items()
+            ],
         )
 
     check_for_debug_crash(sensor_debug_crash_flags, "RUN_IDS_ADDED_TO_EVALUATIONS")
 
-    if skipped_runs:
+    # the run keys are only serialized if the message will actually be logged
+    if skipped_runs and context.logger.isEnabledFor(logging.INFO):
         run_keys = [skipped.run_key for skipped in skipped_runs]
         skipped_count = len(skipped_runs)
         context.logger.info(
@@ -1164,6 +1609,36 @@ def submit_run_request(
     yield
 
 
+T = TypeVar("T")
+U = TypeVar("U")
+
+
+def _map_with_bounded_prefetch(
+    executor: ThreadPoolExecutor,
+    fn: Callable[[T], U],
+    items: Iterable[T],
+    max_inflight: int,
+) -> Iterator[U]:
+    """Like executor.map, but only keeps up to max_inflight items submitted to the executor at a
+    time instead of submitting every item up front. Results are yielded in the order of the items.
+    """
+    items_iter = iter(items)
+    inflight: Deque[Future] = deque(
+        executor.submit(fn, item) for item in islice(items_iter, max_inflight)
+    )
+    try:
+        while inflight:
+            result = inflight.popleft().result()
+            # replace the finished item before handing back its result, so the executor stays busy
+            # while the caller handles it
+            for item in islice(items_iter, 1):
+                inflight.append(executor.submit(fn, item))
+            yield result
+    finally:
+        for future in inflight:
+            future.cancel()
+
+
 def _submit_backfill_request(
     backfill_id: str,
     run_request: RunRequest,
@@ -1187,28 +1662,43 @@ def _submit_backfill_request(
 
 
 def is_under_min_interval(state: InstigatorState, external_sensor: ExternalSensor) -> bool:
+    next_eligible_timestamp = _get_next_eligible_timestamp(state, external_sensor)
+    if next_eligible_timestamp is None:
+        return False
+
+    return get_current_timestamp() < next_eligible_timestamp
+
+
+def _get_next_eligible_timestamp(
+    state: InstigatorState, external_sensor: ExternalSensor
+) -> Optional[float]:
+    """Returns the timestamp at which the sensor's min_interval will have elapsed since its last
+    tick, or None if the sensor can be evaluated at any time.
+    """
     instigator_data = _sensor_instigator_data(state)
     if not instigator_data:
-        return False
+        return None
 
     if not instigator_data.last_tick_start_timestamp and not instigator_data.last_tick_timestamp:
-        return False
+        return None
 
     if not external_sensor.min_interval_seconds:
-        return False
+        return None
 
-    elapsed = get_current_timestamp() - max(
-        instigator_data.last_tick_timestamp or 0,
-        instigator_data.last_tick_start_timestamp or 0,
+    return (
+        max(
+            instigator_data.last_tick_timestamp or 0,
+            instigator_data.last_tick_start_timestamp or 0,
+        )
+        + external_sensor.min_interval_seconds
     )
-    return elapsed < external_sensor.min_interval_seconds
 
 
 def _fetch_existing_runs(
     instance: DagsterInstance,
     external_sensor: ExternalSensor,
     run_requests: Sequence[RunRequest],
-):
+) -> Mapping[Optional[str], DagsterRun]:
     run_keys = [run_request.run_key for run_request in run_requests if run_request.run_key]
 
     if not run_keys:
@@ -1217,37 +1707,52 @@ def _fetch_existing_runs(
     # fetch runs from the DB with only the run key tag
     # note: while possible to filter more at DB level with tags - it is avoided here due to observed
     # perf problems
+    unique_run_keys = list(dict.fromkeys(run_keys))
     runs_with_run_keys = []
-    for run_key in run_keys:
-        # do serial fetching, which has better perf than a single query with an IN clause, due to
-        # how the query planner does the runs/run_tags join
+    for i in range(0, len(unique_run_keys), RUN_KEY_FETCH_BATCH_SIZE):
+        # fetch in small batches rather than in a single query with an IN clause over every key,
+        # which the query planner handles poorly for the runs/run_tags join, while still avoiding
+        # a round trip per run key
+        run_key_batch = unique_run_keys[i : i + RUN_KEY_FETCH_BATCH_SIZE]
         runs_with_run_keys.extend(
-            instance.get_runs(filters=RunsFilter(tags={RUN_KEY_TAG: run_key}))
+            instance.get_runs(filters=RunsFilter(tags={RUN_KEY_TAG: run_key_batch}))
         )
 
     # filter down to runs with run_key that match the sensor name and its namespace (repository)
-    valid_runs: List[DagsterRun] = []
+    sensor_name = external_sensor.name
+    sensor_repository_selector_id = (
+        external_sensor.get_external_origin().repository_origin.get_selector_id()
+    )
+    existing_runs: Dict[Optional[str], DagsterRun] = {}
     for run in runs_with_run_keys:
-        # if the run doesn't have a set origin, just match on sensor name
+        tags = run.tags or {}
+        if tags.get(SENSOR_NAME_TAG) != sensor_name:
+            continue
+        # if the run doesn't have a set origin, just match on sensor name, otherwise prevent the
+        # same named sensor across repos from effecting each other
         if (
-            run.external_job_origin is None
-            and run.tags.get(SENSOR_NAME_TAG) == external_sensor.name
-        ):
-            valid_runs.append(run)
-        # otherwise prevent the same named sensor across repos from effecting each other
-        elif (
             run.external_job_origin is not None
             and run.external_job_origin.repository_origin.get_selector_id()
-            == external_sensor.get_external_origin().repository_origin.get_selector_id()
-            and run.tags.get(SENSOR_NAME_TAG) == external_sensor.name
+            != sensor_repository_selector_id
         ):
-            valid_runs.append(run)
+            continue
+        existing_runs[tags.get(RUN_KEY_TAG)] = run
+
+    return existing_runs
 
-    existing_runs = {}
-    for run in valid_runs:
-        tags = run.tags or {}
-        run_key = tags.get(RUN_KEY_TAG)
-        existing_runs[run_key] = run
+
+def _fetch_existing_runs_by_id(
+    instance: DagsterInstance,
+    run_ids: Sequence[str],
+) -> Mapping[str, DagsterRun]:
+    # runs for the reserved run ids may already exist if a previous attempt at this tick was
+    # interrupted after creating them, so look them up in batches rather than one query per run id,
+    # keeping each IN clause within the parameter limits of the storage
+    existing_runs: Dict[str, DagsterRun] = {}
+    for i in range(0, len(run_ids), RUN_KEY_FETCH_BATCH_SIZE):
+        run_id_batch = run_ids[i : i + RUN_KEY_FETCH_BATCH_SIZE]
+        for run in instance.get_runs(filters=RunsFilter(run_ids=list(run_id_batch))):
+            existing_runs[run.run_id] = run
 
     return existing_runs
 
@@ -1262,8 +1767,12 @@ def _get_or_create_sensor_run(
     run_request: RunRequest,
     target_data: ExternalTargetData,
     existing_runs_by_key: Mapping[Optional[str], DagsterRun],
+    existing_runs_by_id: Mapping[str, DagsterRun],
+    sensor_tags: Mapping[str, str],
+    job_tags_by_name: Dict[str, Mapping[str, str]],
+    execution_plans_by_key: Dict[Tuple[str, str], ExternalExecutionPlan],
 ) -> Union[DagsterRun, SkippedSensorRun]:
-    run = existing_runs_by_key.get(run_request.run_key) or instance.get_run_by_id(run_id)
+    run = existing_runs_by_key.get(run_request.run_key) or existing_runs_by_id.get(run_id)
 
     if run:
         if run.status != DagsterRunStatus.NOT_STARTED:
@@ -1280,10 +1789,30 @@ def _get_or_create_sensor_run(
     logger.info(f"Creating new run for {external_sensor.name}")
 
     return _create_sensor_run(
-        instance, code_location, external_sensor, external_job, run_id, run_request, target_data
+        instance,
+        code_location,
+        external_sensor,
+        external_job,
+        run_id,
+        run_request,
+        target_data,
+        sensor_tags,
+        job_tags_by_name,
+        execution_plans_by_key,
     )
 
 
+def _get_execution_plan_key(
+    external_job: ExternalJob, run_config: Mapping[str, Any]
+) -> Optional[Tuple[str, str]]:
+    try:
+        serialized_run_config = seven.json.dumps(run_config, sort_keys=True)
+    except TypeError:
+        # run config that cannot be serialized is not cached
+        return None
+    return external_job.computed_job_snapshot_id, serialized_run_config
+
+
 def _create_sensor_run(
     instance: DagsterInstance,
     code_location: CodeLocation,
@@ -1292,27 +1821,43 @@ def _create_sensor_run(
     run_id: str,
     run_request: RunRequest,
     target_data: ExternalTargetData,
+    sensor_tags: Mapping[str, str],
+    job_tags_by_name: Dict[str, Mapping[str, str]],
+    execution_plans_by_key: Dict[Tuple[str, str], ExternalExecutionPlan],
 ) -> DagsterRun:
     from dagster._daemon.daemon import get_telemetry_daemon_session_id
 
-    external_execution_plan = code_location.get_external_execution_plan(
-        external_job,
-        run_request.run_config,
-        step_keys_to_execute=None,
-        known_state=None,
-        instance=instance,
-    )
+    # sensors often request many runs of the same job with the same config, which share an
+    # execution plan, so the plan is only fetched from the code location once per tick
+    plan_key = _get_execution_plan_key(external_job, run_request.run_config)
+    external_execution_plan = execution_plans_by_key.get(plan_key) if plan_key else None
+    if external_execution_plan is None:
+        external_execution_plan = code_location.get_external_execution_plan(
+            external_job,
+            run_request.run_config,
+            step_keys_to_execute=None,
+            known_state=None,
+            instance=instance,
+        )
+        if plan_key:
+            execution_plans_by_key[plan_key] = external_execution_plan
     execution_plan_snapshot = external_execution_plan.execution_plan_snapshot
 
-    job_tags = normalize_tags(
-        external_job.tags or {}, allow_reserved_tags=False, warn_on_deprecated_tags=False
-    ).tags
-    tags = merge_dicts(
-        merge_dicts(job_tags, run_request.tags),
+    # job tags do not depend on the op or asset selection, so they are shared by every run of the
+    # tick that targets the same job
+    job_tags = job_tags_by_name.get(external_job.name)
+    if job_tags is None:
+        job_tags = normalize_tags(
+            external_job.tags or {}, allow_reserved_tags=False, warn_on_deprecated_tags=False
+        ).tags
+        job_tags_by_name[external_job.name] = job_tags
+    tags = {
+        **job_tags,
+        **run_request.tags,
         # this gets applied in the sensor definition too, but we apply it here for backcompat
         # with sensors before the tag was added to the sensor definition
-        DagsterRun.tags_for_sensor(external_sensor),
-    )
+        **sensor_tags,
+    }
     if run_request.run_key:
         tags[RUN_KEY_TAG] = run_request.run_key
 
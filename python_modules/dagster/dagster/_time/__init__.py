@@ -42,6 +42,18 @@ def get_current_timestamp() -> float:
     return _mockable_get_current_timestamp()
 
 
+def _mockable_get_monotonic_time() -> float:
+    return time.monotonic()
+
+
+def get_monotonic_time() -> float:
+    """Return the value of a monotonic clock, for measuring elapsed time. Unlike
+    get_current_timestamp, this is not affected by system clock updates and is not
+    mocked by freeze_time.
+    """
+    return _mockable_get_monotonic_time()
+
+
 def get_timezone(timezone_name: str) -> tzinfo:
     """Creates a tzinfo object with the given IANA timezone name."""
     if timezone_name == "utc" or timezone_name == "UTC":
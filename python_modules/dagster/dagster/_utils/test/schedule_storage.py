@@ -640,6 +640,51 @@ def test_update_sensor_tick_to_failure(self, storage):
         assert tick.run_ids == []
         assert tick.error == error
 
+    def test_add_instigator_states(self, storage):
+        assert storage
+
+        states = [
+            self.build_sensor("my_sensor", status=InstigatorStatus.RUNNING),
+            self.build_sensor("my_sensor_2", status=InstigatorStatus.DECLARED_IN_CODE),
+        ]
+        storage.add_instigator_states(states)
+
+        sensors = storage.all_instigator_state(
+            self.fake_repo_target().get_id(),
+            self.fake_repo_target().get_selector_id(),
+            InstigatorType.SENSOR,
+        )
+        assert len(sensors) == 2
+        assert {s.instigator_name for s in sensors} == {"my_sensor", "my_sensor_2"}
+
+        for state in states:
+            stored_state = storage.get_instigator_state(
+                state.instigator_origin_id, state.selector_id
+            )
+            assert stored_state.status == state.status
+
+    def test_update_tick_and_instigator_state(self, storage):
+        assert storage
+
+        state = self.build_sensor("my_sensor")
+        storage.add_instigator_state(state)
+
+        current_time = time.time()
+        tick = storage.create_tick(self.build_sensor_tick(current_time))
+
+        storage.update_tick_and_instigator_state(
+            tick.with_status(TickStatus.SUCCESS).with_run_info(run_id="1234"),
+            state.with_status(InstigatorStatus.RUNNING),
+        )
+
+        ticks = storage.get_ticks("my_sensor", "my_sensor")
+        assert len(ticks) == 1
+        assert ticks[0].status == TickStatus.SUCCESS
+        assert ticks[0].run_ids == ["1234"]
+
+        state = storage.get_instigator_state(state.instigator_origin_id, state.selector_id)
+        assert state.status == InstigatorStatus.RUNNING
+
     def test_purge_ticks(self, storage):
         assert storage
 
@@ -887,6 +932,56 @@ def test_auto_materialize_asset_evaluations(self, storage) -> None:
         assert res[0].evaluation_id == 11
         assert res[0].get_evaluation_with_run_ids(None).evaluation == eval_asset_three.evaluation
 
+    def test_update_auto_materialize_asset_evaluations(self, storage) -> None:
+        if not self.can_store_auto_materialize_asset_evaluations():
+            pytest.skip("Storage cannot store auto materialize asset evaluations")
+
+        condition_snapshot = AutomationConditionSnapshot(
+            class_name="foo", description="bar", unique_id=""
+        )
+        evaluations = [
+            AutomationConditionEvaluation(
+                condition_snapshot=condition_snapshot,
+                true_subset=AssetSubset(asset_key=AssetKey(asset_name), value=True),
+                candidate_subset=AssetSubset(asset_key=AssetKey(asset_name), value=True),
+                start_timestamp=0,
+                end_timestamp=1,
+                subsets_with_metadata=[],
+                child_evaluations=[],
+            ).with_run_ids(set())
+            for asset_name in ["asset_one", "asset_two", "asset_three"]
+        ]
+        storage.add_auto_materialize_asset_evaluations(
+            evaluation_id=10, asset_evaluations=evaluations
+        )
+        storage.add_auto_materialize_asset_evaluations(
+            evaluation_id=11, asset_evaluations=evaluations
+        )
+
+        storage.update_auto_materialize_asset_evaluations(
+            evaluation_id=10,
+            asset_evaluations=[
+                evaluations[0]._replace(run_ids=frozenset({"run_one"})),
+                evaluations[1]._replace(run_ids=frozenset({"run_one", "run_two"})),
+            ],
+        )
+
+        run_ids_by_key = {
+            record.asset_key: record.get_evaluation_with_run_ids(None).run_ids
+            for record in storage.get_auto_materialize_evaluations_for_evaluation_id(
+                evaluation_id=10
+            )
+        }
+        assert run_ids_by_key == {
+            AssetKey("asset_one"): {"run_one"},
+            AssetKey("asset_two"): {"run_one", "run_two"},
+            AssetKey("asset_three"): set(),
+        }
+
+        # evaluations for other evaluation ids are unchanged
+        for record in storage.get_auto_materialize_evaluations_for_evaluation_id(evaluation_id=11):
+            assert record.get_evaluation_with_run_ids(None).run_ids == set()
+
     def test_auto_materialize_asset_evaluations_with_partitions(self, storage) -> None:
         if not self.can_store_auto_materialize_asset_evaluations():
             pytest.skip("Storage cannot store auto materialize asset evaluations")
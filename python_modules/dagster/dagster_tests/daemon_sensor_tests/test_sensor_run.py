@@ -77,9 +77,11 @@
     InstigatorState,
     InstigatorStatus,
     SensorInstigatorData,
+    TickData,
     TickStatus,
 )
 from dagster._core.storage.captured_log_manager import CapturedLogManager
+from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
 from dagster._core.test_utils import (
     BlockingThreadPoolExecutor,
     create_test_daemon_workspace_context,
@@ -87,12 +89,24 @@
     instance_for_test,
     wait_for_futures,
 )
+from dagster._core.utils import FuturesAwareThreadPoolExecutor, make_new_run_id
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._daemon import get_default_daemon_logger
 from dagster._daemon.daemon import SpanMarker
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    SensorEligibilityCache,
+    SensorEnumerationCache,
+    SensorLaunchContext,
+    TickPurgeCoalescer,
+    _fetch_existing_runs,
+    _fetch_existing_runs_by_id,
+    _map_with_bounded_prefetch,
+    _process_tick,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
 from dagster._record import copy
-from dagster._time import create_datetime, get_current_datetime
+from dagster._time import create_datetime, get_current_datetime, get_current_timestamp
 from dagster._vendored.dateutil.relativedelta import relativedelta
 from mock import patch
 
@@ -473,6 +487,13 @@ def run_request_stale_asset_sensor(_context):
     yield RunRequest(run_key=None, stale_assets_only=True)
 
 
+@sensor(job=asset_job)
+def multiple_run_request_stale_asset_sensor(_context):
+    yield RunRequest(run_key="a", asset_selection=[AssetKey("a")], stale_assets_only=True)
+    yield RunRequest(run_key="all", stale_assets_only=True)
+    yield RunRequest(run_key="b_c", asset_selection=[AssetKey("b"), AssetKey("c")])
+
+
 @sensor(job=hourly_asset_job)
 def partitioned_asset_selection_sensor(_context):
     return hourly_asset_job.run_request_for_partition(
@@ -841,6 +862,7 @@ def the_repo():
         load_asset_checks_from_current_module(),
         run_request_asset_selection_sensor,
         run_request_stale_asset_sensor,
+        multiple_run_request_stale_asset_sensor,
         weekly_asset_job,
         multi_asset_sensor_hourly_to_weekly,
         multi_asset_sensor_hourly_to_hourly,
@@ -1637,6 +1659,404 @@ def test_sensor_spans(workspace_context):
             break
 
 
+def test_sensor_enumeration_cache(workspace_context):
+    cache = SensorEnumerationCache()
+    workspace_snapshot = workspace_context.create_request_context().get_workspace_snapshot()
+
+    sensors = cache.get_sensors(workspace_snapshot)
+    assert sensors
+    assert not any(sensor.sensor_type.is_handled_by_asset_daemon for sensor in sensors)
+
+    # unchanged code locations are not re-enumerated
+    cached_sensors = cache.get_sensors(workspace_snapshot)
+    assert len(cached_sensors) == len(sensors)
+    assert all(cached is sensor for cached, sensor in zip(cached_sensors, sensors))
+
+    # code locations removed from the workspace are dropped
+    assert cache.get_sensors({}) == []
+
+
+def test_sensor_eligibility_cache(instance, workspace_context, external_repo):
+    freeze_datetime = create_datetime(year=2019, month=2, day=27, hour=23, minute=59, second=59)
+    logger = get_default_daemon_logger("SensorDaemon")
+    sensor_enumeration_cache = mock.MagicMock(wraps=SensorEnumerationCache())
+    sensor_eligibility_cache = SensorEligibilityCache()
+
+    def _evaluate_sensors():
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                logger,
+                threadpool_executor=None,
+                submit_threadpool_executor=None,
+                sensor_enumeration_cache=sensor_enumeration_cache,
+                sensor_eligibility_cache=sensor_eligibility_cache,
+            )
+        )
+
+    def _get_ticks(external_sensor):
+        return instance.get_ticks(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id
+        )
+
+    simple_sensor = external_repo.get_external_sensor("simple_sensor")
+    always_on_sensor = external_repo.get_external_sensor("always_on_sensor")
+
+    with freeze_time(freeze_datetime):
+        instance.add_instigator_state(
+            InstigatorState(
+                simple_sensor.get_external_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.RUNNING,
+            )
+        )
+        _evaluate_sensors()
+        assert len(_get_ticks(simple_sensor)) == 1
+
+    # a full pass finds the sensor under its min interval
+    with freeze_time(freeze_datetime + relativedelta(seconds=5)):
+        _evaluate_sensors()
+        assert sensor_enumeration_cache.get_sensors.call_count == 2
+
+    # nothing has changed and no sensor is eligible yet, so the sensors are not visited
+    with freeze_time(freeze_datetime + relativedelta(seconds=10)):
+        _evaluate_sensors()
+        assert sensor_enumeration_cache.get_sensors.call_count == 2
+        assert len(_get_ticks(simple_sensor)) == 1
+
+        # starting another sensor invalidates the cache
+        instance.add_instigator_state(
+            InstigatorState(
+                always_on_sensor.get_external_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.RUNNING,
+            )
+        )
+        _evaluate_sensors()
+        assert sensor_enumeration_cache.get_sensors.call_count == 3
+        assert len(_get_ticks(always_on_sensor)) == 1
+        assert len(_get_ticks(simple_sensor)) == 1
+
+    # once the min interval elapses, the sensor is evaluated again
+    with freeze_time(freeze_datetime + relativedelta(seconds=30)):
+        _evaluate_sensors()
+        assert len(_get_ticks(simple_sensor)) == 2
+
+
+def test_prefetch_latest_ticks(instance, workspace_context, external_repo, executor):
+    freeze_datetime = create_datetime(year=2019, month=2, day=27, hour=23, minute=59, second=59)
+    external_sensors = [
+        external_repo.get_external_sensor(sensor_name)
+        for sensor_name in ["simple_sensor", "always_on_sensor"]
+    ]
+
+    with freeze_time(freeze_datetime):
+        for external_sensor in external_sensors:
+            instance.add_instigator_state(
+                InstigatorState(
+                    external_sensor.get_external_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+            # a dangling tick, as left by a daemon that was interrupted mid-tick
+            instance.create_tick(
+                TickData(
+                    instigator_origin_id=external_sensor.get_external_origin_id(),
+                    instigator_name=external_sensor.name,
+                    instigator_type=InstigatorType.SENSOR,
+                    status=TickStatus.STARTED,
+                    timestamp=get_current_timestamp(),
+                    selector_id=external_sensor.selector_id,
+                )
+            )
+
+    assert instance.supports_batch_tick_queries
+
+    with freeze_time(freeze_datetime + relativedelta(seconds=30)):
+        with mock.patch.object(instance, "get_ticks", wraps=instance.get_ticks) as get_ticks:
+            evaluate_sensors(workspace_context, executor)
+            assert get_ticks.call_count == 0
+
+        for external_sensor in external_sensors:
+            ticks = instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            assert len(ticks) == 2
+            assert ticks[0].status != TickStatus.STARTED
+            assert ticks[1].status == TickStatus.SKIPPED
+
+
+def test_sensor_tick_submission_limit(instance, workspace_context, external_repo):
+    external_sensors = [
+        external_repo.get_external_sensor(sensor_name)
+        for sensor_name in ["simple_sensor", "always_on_sensor", "run_key_sensor"]
+    ]
+    for external_sensor in external_sensors:
+        instance.add_instigator_state(
+            InstigatorState(
+                external_sensor.get_external_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.RUNNING,
+            )
+        )
+
+    proceed = threading.Event()
+
+    def _blocked_process_tick(*args, **kwargs):
+        assert proceed.wait(60)
+        return _process_tick(*args, **kwargs)
+
+    logger = get_default_daemon_logger("SensorDaemon")
+    futures = {}
+    with FuturesAwareThreadPoolExecutor(max_workers=1) as executor, mock.patch(
+        "dagster._daemon.sensor._process_tick", _blocked_process_tick
+    ):
+        # a single worker allows two ticks to be in flight, so the third sensor is deferred
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                logger,
+                threadpool_executor=executor,
+                submit_threadpool_executor=None,
+                sensor_tick_futures=futures,
+            )
+        )
+        assert len(futures) == 2
+        deferred_selector_ids = {
+            external_sensor.selector_id for external_sensor in external_sensors
+        } - set(futures.keys())
+        assert len(deferred_selector_ids) == 1
+
+        proceed.set()
+        wait_for_futures(futures)
+
+        # block the deferred sensor's tick again, so that its future is still in flight when the
+        # submitted sensors are checked
+        proceed.clear()
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                logger,
+                threadpool_executor=executor,
+                submit_threadpool_executor=None,
+                sensor_tick_futures=futures,
+            )
+        )
+        assert set(futures.keys()) == deferred_selector_ids
+
+        proceed.set()
+        wait_for_futures(futures)
+
+    for external_sensor in external_sensors:
+        assert (
+            len(
+                instance.get_ticks(
+                    external_sensor.get_external_origin_id(), external_sensor.selector_id
+                )
+            )
+            == 1
+        )
+
+
+def test_sensor_stopped_while_tick_queued(instance, workspace_context, external_repo):
+    external_sensors = [
+        external_repo.get_external_sensor(sensor_name)
+        for sensor_name in ["simple_sensor", "always_on_sensor"]
+    ]
+    for external_sensor in external_sensors:
+        instance.start_sensor(external_sensor)
+
+    started = threading.Event()
+    proceed = threading.Event()
+    started_sensor_names = []
+
+    def _blocked_process_tick(*args, **kwargs):
+        started_sensor_names.append(args[2].name)
+        started.set()
+        assert proceed.wait(60)
+        return _process_tick(*args, **kwargs)
+
+    logger = get_default_daemon_logger("SensorDaemon")
+    futures = {}
+    with FuturesAwareThreadPoolExecutor(max_workers=1) as executor, mock.patch(
+        "dagster._daemon.sensor._process_tick", _blocked_process_tick
+    ):
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                logger,
+                threadpool_executor=executor,
+                submit_threadpool_executor=None,
+                sensor_tick_futures=futures,
+            )
+        )
+        assert len(futures) == 2
+        assert started.wait(60)
+
+        # the single worker is busy with one tick, so the other sensor's tick is still queued
+        queued_sensor = next(
+            external_sensor
+            for external_sensor in external_sensors
+            if external_sensor.name not in started_sensor_names
+        )
+        instance.stop_sensor(
+            queued_sensor.get_external_origin_id(), queued_sensor.selector_id, queued_sensor
+        )
+
+        proceed.set()
+        wait_for_futures(futures)
+
+    state = instance.get_instigator_state(
+        queued_sensor.get_external_origin_id(), queued_sensor.selector_id
+    )
+    assert state
+    assert state.status == InstigatorStatus.STOPPED
+    assert (
+        len(instance.get_ticks(queued_sensor.get_external_origin_id(), queued_sensor.selector_id))
+        == 0
+    )
+
+
+def test_sensor_state_deleted_during_tick(instance, external_repo):
+    external_sensor = external_repo.get_external_sensor("simple_sensor")
+    instance.add_instigator_state(
+        InstigatorState(
+            external_sensor.get_external_origin(),
+            InstigatorType.SENSOR,
+            InstigatorStatus.RUNNING,
+        )
+    )
+    tick = instance.create_tick(
+        TickData(
+            instigator_origin_id=external_sensor.get_external_origin_id(),
+            instigator_name=external_sensor.name,
+            instigator_type=InstigatorType.SENSOR,
+            status=TickStatus.STARTED,
+            timestamp=get_current_timestamp(),
+            selector_id=external_sensor.selector_id,
+        )
+    )
+
+    with SensorLaunchContext(
+        external_sensor,
+        tick,
+        instance,
+        get_default_daemon_logger("SensorDaemon"),
+        purge_settings=[],
+    ) as tick_context:
+        instance.delete_instigator_state(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id
+        )
+        tick_context.update_state(TickStatus.SKIPPED)
+
+    # the finished tick is still written, and the deleted state is not recreated
+    ticks = instance.get_ticks(
+        external_sensor.get_external_origin_id(), external_sensor.selector_id
+    )
+    assert len(ticks) == 1
+    assert ticks[0].status == TickStatus.SKIPPED
+    assert not instance.get_instigator_state(
+        external_sensor.get_external_origin_id(), external_sensor.selector_id
+    )
+
+
+def test_fetch_existing_runs_in_batches(monkeypatch, instance, external_repo):
+    monkeypatch.setattr("dagster._daemon.sensor.RUN_KEY_FETCH_BATCH_SIZE", 2)
+    external_sensor = external_repo.get_external_sensor("run_key_sensor")
+    for run_key in ["a", "b", "c"]:
+        the_job.execute_in_process(
+            tags={RUN_KEY_TAG: run_key, SENSOR_NAME_TAG: external_sensor.name}, instance=instance
+        )
+    # runs with a matching run key that were not launched by the sensor are ignored
+    the_job.execute_in_process(tags={RUN_KEY_TAG: "d"}, instance=instance)
+
+    with patch.object(DagsterInstance, "get_runs", wraps=instance.get_runs) as mock_get_runs:
+        existing_runs = _fetch_existing_runs(
+            instance,
+            external_sensor,
+            [RunRequest(run_key=run_key) for run_key in ["a", "b", "b", "c", "d", "e"]],
+        )
+        # five distinct run keys are fetched in batches of two
+        assert mock_get_runs.call_count == 3
+
+    assert set(existing_runs.keys()) == {"a", "b", "c"}
+    assert all(run.tags[RUN_KEY_TAG] == run_key for run_key, run in existing_runs.items())
+
+
+def test_fetch_existing_runs_by_id_in_batches(monkeypatch, instance):
+    monkeypatch.setattr("dagster._daemon.sensor.RUN_KEY_FETCH_BATCH_SIZE", 2)
+    run_ids = [the_job.execute_in_process(instance=instance).run_id for _ in range(3)]
+
+    with patch.object(DagsterInstance, "get_runs", wraps=instance.get_runs) as mock_get_runs:
+        existing_runs = _fetch_existing_runs_by_id(instance, [*run_ids, make_new_run_id()])
+        # four run ids are fetched in batches of two
+        assert mock_get_runs.call_count == 2
+
+    assert set(existing_runs.keys()) == set(run_ids)
+
+
+def test_map_with_bounded_prefetch():
+    lock = threading.Lock()
+    inflight = 0
+    max_inflight = 0
+
+    def _square(x):
+        nonlocal inflight, max_inflight
+        with lock:
+            inflight += 1
+            max_inflight = max(max_inflight, inflight)
+        time.sleep(0.01)
+        with lock:
+            inflight -= 1
+        return x * x
+
+    submitted = []
+
+    def _items():
+        for i in range(20):
+            submitted.append(i)
+            yield i
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = _map_with_bounded_prefetch(executor, _square, _items(), max_inflight=3)
+        assert next(results) == 0
+        # only the items needed to keep three in flight have been pulled from the input
+        assert len(submitted) == 4
+        assert list(results) == [i * i for i in range(1, 20)]
+
+    assert max_inflight <= 3
+
+
+def test_sensor_loop_interval_jitter(monkeypatch, workspace_context):
+    with ExitStack() as stack:
+        stack.enter_context(freeze_time(create_datetime(year=2019, month=2, day=28)))
+        monkeypatch.setattr("dagster._time._mockable_get_monotonic_time", get_current_timestamp)
+        sleeps = []
+
+        def fake_sleep(s):
+            sleeps.append(s)
+            stack.enter_context(freeze_time(get_current_datetime() + datetime.timedelta(seconds=s)))
+
+        shutdown_event = mock.MagicMock()
+        shutdown_event.wait.side_effect = fake_sleep
+        loop = execute_sensor_iteration_loop(
+            workspace_context,
+            get_default_daemon_logger("dagster.daemon.SensorDaemon"),
+            shutdown_event=shutdown_event,
+            jitter_loop_interval=True,
+        )
+
+        for _i in range(100):
+            next(loop)
+            if len(sleeps) == 3:
+                break
+
+        assert len(sleeps) == 3
+        for sleep in sleeps:
+            assert 2.5 <= sleep <= 7.5
+
+
 def test_custom_interval_sensor_with_offset(
     monkeypatch, executor, instance, workspace_context, external_repo
 ):
@@ -1652,6 +2072,7 @@ def fake_sleep(s):
             stack.enter_context(freeze_time(get_current_datetime() + datetime.timedelta(seconds=s)))
 
         monkeypatch.setattr(time, "sleep", fake_sleep)
+        monkeypatch.setattr("dagster._time._mockable_get_monotonic_time", get_current_timestamp)
 
         shutdown_event = mock.MagicMock()
         shutdown_event.wait.side_effect = fake_sleep
@@ -1778,7 +2199,21 @@ def test_many_request_sensor(executor, submit_executor, instance, workspace_cont
     with freeze_time(freeze_datetime):
         external_sensor = external_repo.get_external_sensor("many_request_sensor")
         instance.start_sensor(external_sensor)
-        evaluate_sensors(workspace_context, executor, submit_executor=submit_executor)
+        code_location = workspace_context.create_request_context().get_code_location(
+            external_sensor.handle.location_name
+        )
+        code_location_cls = type(code_location)
+        with patch.object(
+            code_location_cls,
+            "get_external_execution_plan",
+            autospec=True,
+            side_effect=code_location_cls.get_external_execution_plan,
+        ) as mock_get_external_execution_plan:
+            evaluate_sensors(workspace_context, executor, submit_executor=submit_executor)
+            # every run request targets the same job with the same config, so the execution
+            # plan is only fetched once for the tick
+            assert mock_get_external_execution_plan.call_count == 1
+
         ticks = instance.get_ticks(
             external_sensor.get_external_origin_id(), external_sensor.selector_id
         )
@@ -1789,6 +2224,7 @@ def test_many_request_sensor(executor, submit_executor, instance, workspace_cont
             freeze_datetime,
             TickStatus.SUCCESS,
         )
+        assert len(ticks[0].run_ids) == 15
 
 
 def test_cursor_sensor(executor, instance, workspace_context, external_repo):
@@ -1964,6 +2400,39 @@ def test_run_request_stale_asset_selection_sensor_subset(
         assert sensor_run.asset_selection == {AssetKey("b"), AssetKey("c")}
 
 
+@pytest.mark.parametrize("use_submit_executor", [False, True])
+def test_multiple_run_request_stale_asset_selection_sensor(
+    use_submit_executor, executor, instance, workspace_context, external_repo
+):
+    freeze_datetime = create_datetime(year=2019, month=2, day=27)
+
+    materialize([a], instance=instance)
+
+    with ExitStack() as stack:
+        stack.enter_context(freeze_time(freeze_datetime))
+        # a futures aware submit pool both resolves the stale assets of the run requests
+        # concurrently and submits the run requests with a bounded prefetch
+        submit_executor = (
+            stack.enter_context(FuturesAwareThreadPoolExecutor(max_workers=2))
+            if use_submit_executor
+            else None
+        )
+        external_sensor = external_repo.get_external_sensor(
+            "multiple_run_request_stale_asset_sensor"
+        )
+        instance.start_sensor(external_sensor)
+        evaluate_sensors(workspace_context, executor, submit_executor=submit_executor)
+        asset_selection_by_run_key = {
+            run.tags[RUN_KEY_TAG]: run.asset_selection
+            for run in instance.get_runs()
+            if run.job_name == "abc"
+        }
+        assert asset_selection_by_run_key == {
+            "all": {AssetKey("b"), AssetKey("c")},
+            "b_c": {AssetKey("b"), AssetKey("c")},
+        }
+
+
 def test_targets_asset_selection_sensor(executor, instance, workspace_context, external_repo):
     freeze_datetime = create_datetime(year=2019, month=2, day=27)
     with freeze_time(freeze_datetime):
@@ -2837,6 +3306,59 @@ def test_sensor_purge(executor, instance, workspace_context, external_repo):
         assert len(ticks) == 2
 
 
+def test_tick_purge_coalescer():
+    coalescer = TickPurgeCoalescer()
+    coalescer.schedule("origin", "selector", 100.0, {TickStatus.SKIPPED})
+    coalescer.schedule("origin", "selector", 200.0, {TickStatus.SKIPPED})
+    coalescer.schedule("origin", "selector", 50.0, {TickStatus.SKIPPED})
+    coalescer.schedule("origin", "selector", 10.0, {TickStatus.SUCCESS, TickStatus.FAILURE})
+
+    instance = mock.MagicMock()
+    list(coalescer.flush(instance))
+
+    # purges for the same sensor and statuses are coalesced into the one with the latest cutoff
+    assert instance.purge_ticks.call_count == 2
+    calls = {
+        frozenset(call.kwargs["tick_statuses"]): call.kwargs["before"]
+        for call in instance.purge_ticks.call_args_list
+    }
+    assert calls == {
+        frozenset({TickStatus.SKIPPED}): 200.0,
+        frozenset({TickStatus.SUCCESS, TickStatus.FAILURE}): 10.0,
+    }
+
+    # flushing clears the pending purges
+    instance.reset_mock()
+    list(coalescer.flush(instance))
+    assert instance.purge_ticks.call_count == 0
+
+
+def test_tick_purge_coalescer_flush_interval():
+    instance = mock.MagicMock()
+
+    with mock.patch("dagster._daemon.sensor.get_monotonic_time") as monotonic_time:
+        monotonic_time.return_value = 1000.0
+        coalescer = TickPurgeCoalescer(flush_interval=30)
+
+        monotonic_time.return_value += 10
+        coalescer.schedule("origin", "selector", 100.0, {TickStatus.SKIPPED})
+        list(coalescer.flush_if_due(instance))
+        assert instance.purge_ticks.call_count == 0
+
+        # purges requested before the interval elapses are coalesced into one
+        coalescer.schedule("origin", "selector", 200.0, {TickStatus.SKIPPED})
+        monotonic_time.return_value += 30
+        list(coalescer.flush_if_due(instance))
+        assert instance.purge_ticks.call_count == 1
+        assert instance.purge_ticks.call_args.kwargs["before"] == 200.0
+
+        # the next flush waits for another full interval
+        coalescer.schedule("origin", "selector", 300.0, {TickStatus.SKIPPED})
+        monotonic_time.return_value += 10
+        list(coalescer.flush_if_due(instance))
+        assert instance.purge_ticks.call_count == 1
+
+
 def test_sensor_custom_purge(executor, workspace_context, external_repo):
     freeze_datetime = create_datetime(year=2019, month=2, day=27, hour=23, minute=59, second=59)
     with instance_for_test(
@@ -3326,6 +3848,41 @@ def cross_code_location_sensor(context):
     assert cross_code_location_sensor
 
 
+def test_sensor_tick_futures_discarded_on_completion(instance, workspace_context, external_repo):
+    freeze_datetime = create_datetime(year=2019, month=2, day=27, hour=23, minute=59, second=59)
+
+    executor = ThreadPoolExecutor()
+
+    with freeze_time(freeze_datetime):
+        external_sensor = external_repo.get_external_sensor("simple_sensor")
+        instance.add_instigator_state(
+            InstigatorState(
+                external_sensor.get_external_origin(),
+                InstigatorType.SENSOR,
+                InstigatorStatus.RUNNING,
+            )
+        )
+
+        futures = {}
+        list(
+            execute_sensor_iteration(
+                workspace_context,
+                get_default_daemon_logger("SensorDaemon"),
+                threadpool_executor=executor,
+                submit_threadpool_executor=None,
+                sensor_tick_futures=futures,
+            )
+        )
+        executor.shutdown(wait=True)
+
+        # completed ticks are no longer tracked as in flight
+        assert futures == {}
+        ticks = instance.get_ticks(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id
+        )
+        assert len(ticks) == 1
+
+
 def test_stale_request_context(instance, workspace_context, external_repo):
     freeze_datetime = create_datetime(year=2019, month=2, day=27, hour=23, minute=59, second=59)
 
@@ -4923,6 +4923,26 @@ def test_delete_dynamic_partitions(self, storage: EventLogStorage):
         storage.delete_dynamic_partition(partitions_def_name="bar", partition_key="foo")
         assert set(storage.get_dynamic_partitions("baz")) == set()
 
+    def test_delete_multiple_dynamic_partitions(self, storage: EventLogStorage):
+        assert storage
+
+        storage.add_dynamic_partitions(
+            partitions_def_name="foo", partition_keys=["foo", "bar", "baz"]
+        )
+        storage.add_dynamic_partitions(partitions_def_name="bar", partition_keys=["foo"])
+
+        storage.delete_dynamic_partitions(partitions_def_name="foo", partition_keys=["foo", "baz"])
+        assert storage.get_dynamic_partitions("foo") == ["bar"]
+        assert storage.get_dynamic_partitions("bar") == ["foo"]
+
+        # partitions that do not exist are ignored
+        storage.delete_dynamic_partitions(partitions_def_name="foo", partition_keys=["foo", "bar"])
+        assert storage.get_dynamic_partitions("foo") == []
+
+        # deleting no partitions is a no-op
+        storage.delete_dynamic_partitions(partitions_def_name="bar", partition_keys=[])
+        assert storage.get_dynamic_partitions("bar") == ["foo"]
+
     def test_has_dynamic_partition(self, storage: EventLogStorage):
         assert storage
         assert storage.get_dynamic_partitions("foo") == []
@@ -4937,6 +4957,20 @@ def test_has_dynamic_partition(self, storage: EventLogStorage):
         assert not storage.has_dynamic_partition(partitions_def_name="foo", partition_key="qux")
         assert not storage.has_dynamic_partition(partitions_def_name="bar", partition_key="foo")
 
+    def test_get_existing_dynamic_partitions(self, storage: EventLogStorage):
+        assert storage
+        assert storage.get_existing_dynamic_partitions("foo", ["foo", "bar"]) == set()
+
+        storage.add_dynamic_partitions(
+            partitions_def_name="foo", partition_keys=["foo", "bar", "baz"]
+        )
+        assert storage.get_existing_dynamic_partitions("foo", ["foo", "qux", "baz"]) == {
+            "foo",
+            "baz",
+        }
+        assert storage.get_existing_dynamic_partitions("foo", []) == set()
+        assert storage.get_existing_dynamic_partitions("bar", ["foo"]) == set()
+
     def test_concurrency(self, storage: EventLogStorage):
         assert storage
         if not storage.supports_global_concurrency_limits:
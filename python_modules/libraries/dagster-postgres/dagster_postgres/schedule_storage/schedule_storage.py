@@ -158,7 +158,9 @@ def upgrade(self) -> None:
         with self.connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
 
-    def _add_or_update_instigators_table(self, conn: Connection, state: InstigatorState) -> None:
+    def _add_or_update_instigators_table(
+        self, conn: Connection, state: InstigatorState, instigator_body: str
+    ) -> None:
         selector_id = state.selector_id
         conn.execute(
             db_dialects.postgresql.insert(InstigatorsTable)
@@ -167,14 +169,14 @@ def _add_or_update_instigators_table(self, conn: Connection, state: InstigatorSt
                 repository_selector_id=state.repository_selector_id,
                 status=state.status.value,
                 instigator_type=state.instigator_type.value,
-                instigator_body=serialize_value(state),
+                instigator_body=instigator_body,
             )
             .on_conflict_do_update(
                 index_elements=[InstigatorsTable.c.selector_id],
                 set_={
                     "status": state.status.value,
                     "instigator_type": state.instigator_type.value,
-                    "instigator_body": serialize_value(state),
+                    "instigator_body": instigator_body,
                     "update_timestamp": get_current_datetime(),
                 },
             )
@@ -213,6 +215,15 @@ def add_auto_materialize_asset_evaluations(
         with self.connect() as conn:
             conn.execute(upsert_stmt)
 
+    def update_auto_materialize_asset_evaluations(
+        self,
+        evaluation_id: int,
+        asset_evaluations: Sequence[AutomationConditionEvaluationWithRunIds],
+    ) -> None:
+        # the multi-row upsert updates all of the evaluations in a single statement, which the
+        # executemany UPDATE of the base sql storage does not
+        self.add_auto_materialize_asset_evaluations(evaluation_id, asset_evaluations)
+
     def alembic_version(self) -> AlembicVersion:
         alembic_config = pg_alembic_config(__file__)
         with self.connect() as conn: